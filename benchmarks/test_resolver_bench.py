@@ -0,0 +1,93 @@
+"""
+Benchmarks for resolver lockfile and manifest parsing.
+
+Run with ``make bench``. These live outside ``tests/`` so the regular suite
+never collects them.
+"""
+
+import asyncio
+
+import pytest
+
+from oss_sustain_guard.resolvers.dart import DartResolver
+from oss_sustain_guard.resolvers.elixir import ElixirResolver
+from oss_sustain_guard.resolvers.go import GoResolver
+
+# Number of packages in each generated file, large enough that parsing
+# dominates file opening.
+PACKAGE_COUNT = 2000
+
+
+def _pubspec_lock() -> str:
+    entries = "".join(
+        f'  pkg_{i}:\n    dependency: "direct main"\n    version: "1.{i}.0"\n'
+        for i in range(PACKAGE_COUNT)
+    )
+    return f"packages:\n{entries}sdks:\n  dart: '>=3.0.0 <4.0.0'\n"
+
+
+def _pubspec_yaml() -> str:
+    deps = "".join(f"  pkg_{i}: ^1.{i}.0\n" for i in range(PACKAGE_COUNT))
+    return f"name: example\ndependencies:\n{deps}"
+
+
+def _mix_lock() -> str:
+    entries = ",\n".join(
+        f'  "pkg_{i}": {{:hex, :pkg_{i}, "1.{i}.0"}}' for i in range(PACKAGE_COUNT)
+    )
+    return f"%{{\n{entries}\n}}\n"
+
+
+def _mix_exs() -> str:
+    deps = ",\n".join(f'      {{:pkg_{i}, "~> 1.{i}"}}' for i in range(PACKAGE_COUNT))
+    return (
+        "defmodule Example.MixProject do\n"
+        "  defp deps do\n"
+        f"    [\n{deps}\n    ]\n"
+        "  end\n"
+        "end\n"
+    )
+
+
+def _go_sum() -> str:
+    return "".join(
+        f"github.com/org/pkg{i} v1.{i}.0 h1:hash{i}=\n" for i in range(PACKAGE_COUNT)
+    )
+
+
+def _go_mod() -> str:
+    requires = "".join(
+        f"  github.com/org/pkg{i} v1.{i}.0\n" for i in range(PACKAGE_COUNT)
+    )
+    return f"module github.com/example/project\ngo 1.21\nrequire (\n{requires})\n"
+
+
+# (resolver class, parse method, file name, content builder)
+_CASES = (
+    (DartResolver, "parse_lockfile", "pubspec.lock", _pubspec_lock),
+    (DartResolver, "parse_manifest", "pubspec.yaml", _pubspec_yaml),
+    (ElixirResolver, "parse_lockfile", "mix.lock", _mix_lock),
+    (ElixirResolver, "parse_manifest", "mix.exs", _mix_exs),
+    (GoResolver, "parse_lockfile", "go.sum", _go_sum),
+    (GoResolver, "parse_manifest", "go.mod", _go_mod),
+)
+
+
+@pytest.mark.parametrize(
+    ("resolver_cls", "method", "filename", "build_content"),
+    _CASES,
+    ids=[filename for _, _, filename, _ in _CASES],
+)
+def test_parse(benchmark, tmp_path, resolver_cls, method, filename, build_content):
+    """Benchmark parsing a generated file with ``PACKAGE_COUNT`` packages."""
+    path = tmp_path / filename
+    path.write_text(build_content())
+    parse = getattr(resolver_cls(), method)
+
+    loop = asyncio.new_event_loop()
+    try:
+        packages = benchmark(lambda: loop.run_until_complete(parse(path)))
+    finally:
+        loop.close()
+
+    assert len(packages) == PACKAGE_COUNT
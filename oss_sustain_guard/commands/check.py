@@ -942,6 +942,10 @@ async def analyze_packages_parallel(
     Returns:
         Tuple of (List of AnalysisResult or None for each package, verbose logs dict)
     """
+    # Nothing to resolve: skip the semaphore and both gather() rounds.
+    if not packages_data:
+        return [], {}
+
     _total = len(packages_data)
     verbose_logs: dict[str, list[str]] = {}  # Collect logs instead of printing directly
 
@@ -962,12 +966,13 @@ async def analyze_packages_parallel(
                 return None
 
             # Check local cache first - if found, we already have the analysis
-            if db_key in db:
-                cached_data = db[db_key]
-                payload_version = cached_data.get("analysis_version")
-                if payload_version == ANALYSIS_VERSION:
-                    # Can reconstruct from cache, return marker
-                    return (idx, eco, pkg_name, None, None, None, "cached")
+            cached_data = db.get(db_key)
+            if (
+                cached_data is not None
+                and cached_data.get("analysis_version") == ANALYSIS_VERSION
+            ):
+                # Can reconstruct from cache, return marker
+                return (idx, eco, pkg_name, None, None, None, "cached")
 
             # Resolve repository
             resolver = get_resolver(eco)
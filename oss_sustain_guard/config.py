@@ -53,6 +53,10 @@ _SCAN_DEPTH: str = "default"
 # Days to look back for temporal filtering (None = no time limit)
 _DAYS_LOOKBACK: int | None = None
 
+# Excluded packages keyed on the config files' (mtime_ns, size) stamps, so
+# repeated exclusion checks cost a stat() per file instead of a TOML parse.
+_EXCLUDED_PACKAGES_CACHE: tuple[tuple, frozenset[str]] | None = None
+
 
 def load_config_file(config_path: Path) -> dict:
     """Load a TOML configuration file."""
@@ -65,7 +69,7 @@ def load_config_file(config_path: Path) -> dict:
         raise ValueError(f"Failed to load config from {config_path}: {e}") from e
 
 
-def get_excluded_packages() -> list[str]:
+def get_excluded_packages() -> frozenset[str]:
     """
     Load excluded packages from configuration files.
 
@@ -74,27 +78,50 @@ def get_excluded_packages() -> list[str]:
     2. pyproject.toml (project-level config, fallback)
 
     Returns:
-        List of excluded package names.
+        Frozen set of excluded package names, lowercased for matching.
     """
+    global _EXCLUDED_PACKAGES_CACHE
+
+    local_config_path = PROJECT_ROOT / ".oss-sustain-guard.toml"
+    pyproject_path = PROJECT_ROOT / "pyproject.toml"
+    local_stamp = _config_file_stamp(local_config_path)
+    pyproject_stamp = _config_file_stamp(pyproject_path)
+    cache_key = (PROJECT_ROOT, local_stamp, pyproject_stamp)
+    if (
+        _EXCLUDED_PACKAGES_CACHE is not None
+        and _EXCLUDED_PACKAGES_CACHE[0] == cache_key
+    ):
+        return _EXCLUDED_PACKAGES_CACHE[1]
+
     excluded = []
 
     # Try .oss-sustain-guard.toml first (highest priority)
-    local_config_path = PROJECT_ROOT / ".oss-sustain-guard.toml"
-    if local_config_path.exists():
+    if local_stamp is not None:
         config = load_config_file(local_config_path)
         excluded.extend(
             config.get("tool", {}).get("oss-sustain-guard", {}).get("exclude", [])
         )
 
     # Try pyproject.toml (fallback)
-    pyproject_path = PROJECT_ROOT / "pyproject.toml"
-    if pyproject_path.exists() and not excluded:
+    if pyproject_stamp is not None and not excluded:
         config = load_config_file(pyproject_path)
         excluded.extend(
             config.get("tool", {}).get("oss-sustain-guard", {}).get("exclude", [])
         )
 
-    return list(set(excluded))  # Remove duplicates
+    # Lowercase once here so is_package_excluded() is a single set probe.
+    excluded_names = frozenset(name.lower() for name in excluded)
+    _EXCLUDED_PACKAGES_CACHE = (cache_key, excluded_names)
+    return excluded_names
+
+
+def _config_file_stamp(config_path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a config file, or None if it is missing."""
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 def is_package_excluded(package_name: str) -> bool:
@@ -107,8 +134,7 @@ def is_package_excluded(package_name: str) -> bool:
     Returns:
         True if the package is excluded, False otherwise.
     """
-    excluded = get_excluded_packages()
-    return package_name.lower() in [pkg.lower() for pkg in excluded]
+    return package_name.lower() in get_excluded_packages()
 
 
 def get_excluded_users() -> list[str]:
@@ -16,10 +16,28 @@ from oss_sustain_guard.http_client import _get_async_http_client
 from oss_sustain_guard.repository import RepositoryReference, parse_repository_url
 from oss_sustain_guard.resolvers.base import LanguageResolver, PackageInfo
 
+# Perl module and distribution names are ASCII, so both patterns use re.ASCII.
+# Matches `requires 'Module::Name'` (either quote style) in a cpanfile.
+_REQUIRES_PATTERN = re.compile(r"requires\s+['\"]([^'\"]+)['\"]", re.ASCII)
+
+# Matches a `distribution: Name-1.23` line in a cpanfile.snapshot.
+_DISTRIBUTION_PATTERN = re.compile(
+    r"^\s*distribution:\s*([A-Za-z0-9_.:-]+)", re.MULTILINE | re.ASCII
+)
+
+# Snapshots larger than this are parsed chunk by chunk to bound memory use.
+_SNAPSHOT_STREAM_THRESHOLD = 4_000_000
+_SNAPSHOT_CHUNK_SIZE = 1 << 20
+
 
 class PerlResolver(LanguageResolver):
     """Resolver for Perl packages via MetaCPAN."""
 
+    def __init__(self) -> None:
+        # MetaCPAN answers keyed by distribution name. Transient request
+        # failures are not cached so a later lookup can retry.
+        self._cache: dict[str, RepositoryReference | None] = {}
+
     @property
     def ecosystem_name(self) -> str:
         return "perl"
@@ -34,6 +52,9 @@ class PerlResolver(LanguageResolver):
         Returns:
             RepositoryReference if a supported repository URL is found, otherwise None.
         """
+        if package_name in self._cache:
+            return self._cache[package_name]
+
         try:
             client = await _get_async_http_client()
             response = await client.get(
@@ -41,6 +62,7 @@ class PerlResolver(LanguageResolver):
                 timeout=10,
             )
             if response.status_code == 404:
+                self._cache[package_name] = None
                 return None
             response.raise_for_status()
             data = response.json()
@@ -65,12 +87,14 @@ class PerlResolver(LanguageResolver):
             if isinstance(web, str) and web:
                 candidates.append(web)
 
+        repo = None
         for candidate in candidates:
             repo = parse_repository_url(candidate)
             if repo:
-                return repo
+                break
 
-        return None
+        self._cache[package_name] = repo
+        return repo
 
     async def parse_lockfile(self, lockfile_path: str | Path) -> list[PackageInfo]:
         """
@@ -94,30 +118,15 @@ class PerlResolver(LanguageResolver):
             raise ValueError(f"Unknown Perl lockfile type: {lockfile_path.name}")
 
         try:
-            async with aiofiles.open(lockfile_path, "r", encoding="utf-8") as f:
-                content = await f.read()
+            if lockfile_path.stat().st_size > _SNAPSHOT_STREAM_THRESHOLD:
+                return await _stream_cpanfile_snapshot(lockfile_path)
+            # One binary read of the whole snapshot, decoded in a single pass.
+            async with aiofiles.open(lockfile_path, "rb") as f:
+                data = await f.read()
         except OSError as e:
             raise ValueError(f"Failed to read cpanfile.snapshot: {e}") from e
 
-        packages = []
-        seen = set()
-        pattern = re.compile(r"distribution:\s*([A-Za-z0-9_.:-]+)")
-
-        for match in pattern.finditer(content):
-            raw_name = match.group(1)
-            name = _strip_distribution_version(raw_name)
-            if name in seen:
-                continue
-            seen.add(name)
-            packages.append(
-                PackageInfo(
-                    name=name,
-                    ecosystem="perl",
-                    registry_url=f"https://metacpan.org/release/{name}",
-                )
-            )
-
-        return packages
+        return _parse_cpanfile_snapshot(data.decode("utf-8", errors="replace"))
 
     async def detect_lockfiles(self, directory: str) -> list[Path]:
         """
@@ -164,25 +173,58 @@ class PerlResolver(LanguageResolver):
         except OSError as e:
             raise ValueError(f"Failed to read cpanfile: {e}") from e
 
-        packages = []
-        seen = set()
-        pattern = re.compile(r"requires\s+['\"]([^'\"]+)['\"]")
+        return _parse_cpanfile(content)
+
+
+def _parse_cpanfile_snapshot(content: str) -> list[PackageInfo]:
+    """Extract distributions from cpanfile.snapshot content."""
+    packages: dict[str, PackageInfo] = {}
+    _collect_distributions(content, packages)
+    return list(packages.values())
+
+
+async def _stream_cpanfile_snapshot(path: Path) -> list[PackageInfo]:
+    """Extract distributions from a large cpanfile.snapshot chunk by chunk."""
+    packages: dict[str, PackageInfo] = {}
+    pending = b""
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(_SNAPSHOT_CHUNK_SIZE):
+            # Only parse complete lines; carry the partial last line over.
+            lines, _, pending = (pending + chunk).rpartition(b"\n")
+            _collect_distributions(lines.decode("utf-8", errors="replace"), packages)
+    _collect_distributions(pending.decode("utf-8", errors="replace"), packages)
+    return list(packages.values())
+
+
+def _collect_distributions(content: str, packages: dict[str, PackageInfo]) -> None:
+    """Add distributions found in content to packages, keeping the first seen."""
+    for match in _DISTRIBUTION_PATTERN.finditer(content):
+        name = _strip_distribution_version(match.group(1))
+        if name not in packages:
+            packages[name] = PackageInfo(
+                name=name,
+                ecosystem="perl",
+                registry_url=f"https://metacpan.org/release/{name}",
+            )
 
-        for match in pattern.finditer(content):
-            name = match.group(1)
-            if name in seen:
-                continue
-            seen.add(name)
-            packages.append(PackageInfo(name=name, ecosystem="perl"))
 
-        return packages
+def _parse_cpanfile(content: str) -> list[PackageInfo]:
+    """Extract required modules from cpanfile content."""
+    # dict.fromkeys drops duplicates while keeping first-seen order.
+    names = dict.fromkeys(
+        match.group(1) for match in _REQUIRES_PATTERN.finditer(content)
+    )
+    return [PackageInfo(name=name, ecosystem="perl") for name in names]
 
 
 def _strip_distribution_version(name: str) -> str:
     """Strip version suffix from CPAN distribution names."""
-    match = re.match(r"^(?P<base>.+)-\d", name)
-    if match:
-        return match.group("base")
+    # Cut at the last "-" that is followed by a digit, e.g. "Test-Simple-1.30".
+    index = name.rfind("-")
+    while index > 0:
+        if name[index + 1 : index + 2].isdecimal():
+            return name[:index]
+        index = name.rfind("-", 0, index)
     return name
 
 
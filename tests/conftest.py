@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the whole test suite.
+"""
+
+import pytest
+
+from oss_sustain_guard import http_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_async_http_client():
+    """
+    Drop the shared async HTTP client after each test.
+
+    The client is bound to the event loop of the test that created it, so
+    keeping it around makes later async tests depend on file order, which
+    pytest-xdist does not preserve.
+    """
+    yield
+    http_client._async_http_client = None
+    http_client._http_client_verify_ssl = None
@@ -0,0 +1,102 @@
+"""
+Shared builders for metric test data.
+"""
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+
+from oss_sustain_guard.vcs.base import VCSRepositoryData
+
+# Instant returned by datetime.now() under the frozen_clock fixture.
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_vcs_data(**overrides) -> VCSRepositoryData:
+    """Build repository data with every signal empty, then apply overrides."""
+    data = VCSRepositoryData(
+        is_archived=False,
+        pushed_at=None,
+        owner_type="User",
+        owner_login="owner",
+        owner_name=None,
+        star_count=0,
+        description=None,
+        homepage_url=None,
+        topics=[],
+        readme_size=None,
+        contributing_file_size=None,
+        default_branch="main",
+        watchers_count=0,
+        open_issues_count=0,
+        language=None,
+        commits=[],
+        total_commits=0,
+        merged_prs=[],
+        closed_prs=[],
+        total_merged_prs=0,
+        releases=[],
+        open_issues=[],
+        closed_issues=[],
+        total_closed_issues=0,
+        vulnerability_alerts=None,
+        has_security_policy=False,
+        code_of_conduct=None,
+        license_info=None,
+        has_wiki=False,
+        has_issues=True,
+        has_discussions=False,
+        funding_links=[],
+        forks=[],
+        total_forks=0,
+        ci_status=None,
+        sample_counts={},
+        raw_data=None,
+    )
+    return data._replace(**overrides)
+
+
+def make_commit(login: str, authored_date: str) -> dict:
+    """Build a commit authored by ``login`` at the ISO ``authored_date``."""
+    return {"author": {"user": {"login": login}}, "authoredDate": authored_date}
+
+
+def make_reviewed_pr(
+    created_at: str, *reviewed_at: str, total_count: int | None = None
+) -> dict:
+    """
+    Build a merged PR with GraphQL-shaped review edges from ISO timestamps.
+
+    ``total_count`` defaults to the number of reviews.
+    """
+    edges = [{"node": {"createdAt": at}} for at in reviewed_at]
+    return {
+        "createdAt": created_at,
+        "reviews": {
+            "edges": edges,
+            "totalCount": len(edges) if total_count is None else total_count,
+        },
+    }
+
+
+# Issue ages exercised by the resolution tests, rendered to ISO strings once.
+_RESOLUTION_CREATED_ISO = "2024-01-01T00:00:00"
+_RESOLUTION_CLOSED_ISO = {
+    days: (datetime(2024, 1, 1) + timedelta(days=days)).isoformat()
+    for days in (3, 14, 30, 60, 100, 120, 200, 400, 500, 800)
+}
+
+
+@lru_cache(maxsize=None)
+def repo_with_resolution(stars: int, days: int) -> VCSRepositoryData:
+    """
+    Return repository data with one issue closed ``days`` after it was opened.
+
+    ``days`` must be one of the precomputed ages in ``_RESOLUTION_CLOSED_ISO``.
+    Results are cached and shared between tests, so the closed issue is
+    exposed as a read-only mapping inside a tuple.
+    """
+    issue = MappingProxyType(
+        {"createdAt": _RESOLUTION_CREATED_ISO, "closedAt": _RESOLUTION_CLOSED_ISO[days]}
+    )
+    return make_vcs_data(star_count=stars, closed_issues=(issue,))
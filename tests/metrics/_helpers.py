@@ -0,0 +1,47 @@
+"""
+Assertion helpers shared by metric tests.
+"""
+
+import pytest
+
+from oss_sustain_guard.metrics.base import Metric
+
+
+def assert_metric(
+    result: Metric | None,
+    *,
+    score: int,
+    risk: str,
+    message: str | None = None,
+    contains: str | None = None,
+    prefix: str | None = None,
+    max_score: int = 10,
+    name: str | None = None,
+) -> None:
+    """
+    Assert the common fields of a metric result, reporting all mismatches.
+
+    ``message`` checks the whole message; ``contains`` checks for a fragment
+    anywhere in it; ``prefix`` checks how it starts.
+    """
+    if result is None:
+        pytest.fail("Expected a metric result, got None")
+
+    mismatches = []
+    if name is not None and result.name != name:
+        mismatches.append(f"name {result.name!r} != {name!r}")
+    if result.score != score:
+        mismatches.append(f"score {result.score!r} != {score!r}")
+    if result.max_score != max_score:
+        mismatches.append(f"max_score {result.max_score!r} != {max_score!r}")
+    if message is not None and result.message != message:
+        mismatches.append(f"message {result.message!r} != {message!r}")
+    if contains is not None and contains not in result.message:
+        mismatches.append(f"message {result.message!r} lacks {contains!r}")
+    if prefix is not None and not result.message.startswith(prefix):
+        mismatches.append(f"message {result.message!r} does not start with {prefix!r}")
+    if result.risk != risk:
+        mismatches.append(f"risk {result.risk!r} != {risk!r}")
+
+    if mismatches:
+        pytest.fail("Unexpected metric result: " + "; ".join(mismatches))
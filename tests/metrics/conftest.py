@@ -0,0 +1,80 @@
+"""
+Shared fixtures for metric tests.
+
+Metric checkers only read the repository data they are given, so invariant
+payloads are built once per module and shared between tests.
+"""
+
+import datetime as datetime_module
+from datetime import datetime
+from types import MappingProxyType
+
+import pytest
+
+from oss_sustain_guard.metrics.base import MetricContext
+from oss_sustain_guard.vcs.base import VCSRepositoryData
+
+from ._fixtures import FROZEN_NOW, make_vcs_data
+
+
+@pytest.fixture(scope="module")
+def empty_vcs_data() -> VCSRepositoryData:
+    """Repository data with no optional signals (no issues, docs, or CoC)."""
+    return make_vcs_data()
+
+
+@pytest.fixture(scope="module")
+def no_response_vcs_data() -> VCSRepositoryData:
+    """Repository data with one open issue that never received a comment."""
+    return make_vcs_data(
+        open_issues=[{"createdAt": "2023-01-01T00:00:00Z", "comments": {"edges": []}}]
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_coc_vcs_data() -> VCSRepositoryData:
+    """Repository data with a Code of Conduct entry that has no name."""
+    return make_vcs_data(code_of_conduct={})
+
+
+@pytest.fixture(scope="module")
+def metric_context() -> MetricContext:
+    """Placeholder context for calling MetricSpec checkers directly."""
+    return MetricContext(owner="owner", name="repo", repo_url="url")
+
+
+@pytest.fixture(scope="module")
+def unmerged_closed_prs() -> tuple[dict, ...]:
+    """
+    Closed-without-merge pull requests; tests slice the count they need.
+
+    Every entry is the same read-only mapping, so a checker that mutates its
+    input fails loudly instead of leaking state between tests.
+    """
+    return (MappingProxyType({"merged": False}),) * 100
+
+
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """Fixed UTC instant that time-relative metric tests are built around."""
+    return FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch, frozen_now) -> datetime:
+    """
+    Make ``datetime.now()`` return ``frozen_now`` while a test runs.
+
+    Metric checkers import ``datetime`` inside ``check``, so patching the
+    module attribute is enough for them to read the frozen clock.
+    """
+
+    class _FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            if tz is None:
+                return frozen_now.replace(tzinfo=None)
+            return frozen_now.astimezone(tz)
+
+    monkeypatch.setattr(datetime_module, "datetime", _FrozenDateTime)
+    return frozen_now
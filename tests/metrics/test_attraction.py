@@ -2,53 +2,52 @@
 Tests for the attraction metric.
 """
 
-from datetime import datetime, timedelta, timezone
+import pytest
 
 from oss_sustain_guard.metrics.attraction import check_attraction
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+from ._fixtures import make_commit, make_vcs_data
+from ._helpers import assert_metric
+
+# The checker reads the clock, so every test runs against FROZEN_NOW
+# (2024-01-01 UTC); first commits land 150 days before the clock (inside the
+# six-month window) and 210 days before the clock (outside it).
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+_RECENT_ISO = "2023-08-04T00:00:00+00:00"
+_OLD_ISO = "2023-06-05T00:00:00+00:00"
+
+# (new contributors, old contributors, expected score, expected risk, message)
+_ATTRACTION_TIERS = (
+    (
+        ("user1", "user2", "user3", "user4", "user5"),
+        ("olduser",),
+        10,
+        "None",
+        "Strong: 5 new contributors in last 6 months",
+    ),
+    (
+        ("user1", "user2", "user3"),
+        (),
+        7,
+        "Low",
+        "Good: 3 new contributors in last 6 months",
+    ),
+    (
+        ("user1",),
+        (),
+        4,
+        "Medium",
+        "Moderate: 1 new contributor(s) in last 6 months",
+    ),
+    (
+        (),
+        ("olduser",),
+        0,
+        "Medium",
+        "Observe: No new contributors in last 6 months",
+    ),
+)
 
 
 class TestAttractionMetric:
@@ -56,7 +55,7 @@ class TestAttractionMetric:
 
     def test_attraction_no_default_branch(self):
         """Test when default branch is not available."""
-        vcs_data = _vcs_data(default_branch=None, commits=[])
+        vcs_data = make_vcs_data(default_branch=None, commits=[])
         result = check_attraction(vcs_data)
         assert result.name == "Contributor Attraction"
         assert result.score == 0
@@ -66,7 +65,7 @@ class TestAttractionMetric:
 
     def test_attraction_no_history(self):
         """Test when no commit history is available."""
-        vcs_data = _vcs_data(commits=[])
+        vcs_data = make_vcs_data(commits=[])
         result = check_attraction(vcs_data)
         assert result.name == "Contributor Attraction"
         assert result.score == 0
@@ -74,107 +73,20 @@ class TestAttractionMetric:
         assert "No commit history available for analysis" in result.message
         assert result.risk == "Medium"
 
-    def test_attraction_strong_attraction(self):
-        """Test with 5+ new contributors."""
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        recent_date = six_months_ago + timedelta(days=30)
-        old_date = six_months_ago - timedelta(days=30)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user4"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user5"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "olduser"}},
-                "authoredDate": old_date.isoformat(),
-            },
-        ]
-        result = check_attraction(_vcs_data(commits=commits))
-        assert result.name == "Contributor Attraction"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Strong: 5 new contributors in last 6 months" in result.message
-        assert result.risk == "None"
-
-    def test_attraction_good_attraction(self):
-        """Test with 3-4 new contributors."""
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        recent_date = six_months_ago + timedelta(days=30)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-        ]
-        result = check_attraction(_vcs_data(commits=commits))
-        assert result.name == "Contributor Attraction"
-        assert result.score == 7
-        assert result.max_score == 10
-        assert "Good: 3 new contributors in last 6 months" in result.message
-        assert result.risk == "Low"
-
-    def test_attraction_moderate_attraction(self):
-        """Test with 1-2 new contributors."""
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        recent_date = six_months_ago + timedelta(days=30)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-        ]
-        result = check_attraction(_vcs_data(commits=commits))
-        assert result.name == "Contributor Attraction"
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Moderate: 1 new contributor(s) in last 6 months" in result.message
-        assert result.risk == "Medium"
-
-    def test_attraction_no_new_contributors(self):
-        """Test with no new contributors."""
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        old_date = six_months_ago - timedelta(days=30)
-
-        commits = [
-            {
-                "author": {"user": {"login": "olduser"}},
-                "authoredDate": old_date.isoformat(),
-            },
-        ]
-        result = check_attraction(_vcs_data(commits=commits))
-        assert result.name == "Contributor Attraction"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "Observe: No new contributors in last 6 months" in result.message
-        assert result.risk == "Medium"
+    @pytest.mark.parametrize(
+        ("new_logins", "old_logins", "score", "risk", "message"),
+        _ATTRACTION_TIERS,
+        ids=("strong_5", "good_3", "moderate_1", "none_0"),
+    )
+    def test_attraction_tiers(self, new_logins, old_logins, score, risk, message):
+        """Test scoring tiers for shrinking numbers of new contributors."""
+        commits = [make_commit(login, _RECENT_ISO) for login in new_logins]
+        commits.extend(make_commit(login, _OLD_ISO) for login in old_logins)
+        result = check_attraction(make_vcs_data(commits=commits))
+        assert_metric(
+            result,
+            score=score,
+            risk=risk,
+            contains=message,
+            name="Contributor Attraction",
+        )
@@ -7,48 +7,7 @@ from oss_sustain_guard.metrics.base import MetricContext
 from oss_sustain_guard.metrics.bus_factor import METRIC, check_bus_factor
 from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+from ._fixtures import make_vcs_data
 
 
 def _vcs_with_commits(
@@ -58,7 +17,7 @@ def _vcs_with_commits(
 ) -> VCSRepositoryData:
     commits = [{"author": {"user": {"login": login}}} for login in logins]
     total_commits = total_count if total_count is not None else len(commits)
-    return _vcs_data(
+    return make_vcs_data(
         commits=commits,
         total_commits=total_commits,
         default_branch=default_branch,
@@ -70,7 +29,7 @@ class TestBusFactorMetric:
 
     def test_bus_factor_no_default_branch(self):
         """Test when default branch is not available."""
-        vcs_data = _vcs_data(default_branch=None)
+        vcs_data = make_vcs_data(default_branch=None)
         result = check_bus_factor(vcs_data)
         assert result.name == "Contributor Redundancy"
         assert result.score == 0
@@ -80,7 +39,7 @@ class TestBusFactorMetric:
 
     def test_bus_factor_no_target(self):
         """Test when default branch has no target."""
-        vcs_data = _vcs_data(default_branch=None)
+        vcs_data = make_vcs_data(default_branch=None)
         result = check_bus_factor(vcs_data)
         assert result.name == "Contributor Redundancy"
         assert result.score == 0
@@ -90,7 +49,7 @@ class TestBusFactorMetric:
 
     def test_bus_factor_no_history(self):
         """Test when no commit history is available."""
-        vcs_data = _vcs_data(commits=[])
+        vcs_data = make_vcs_data(commits=[])
         result = check_bus_factor(vcs_data)
         assert result.name == "Contributor Redundancy"
         assert result.score == 0
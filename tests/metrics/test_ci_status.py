@@ -4,50 +4,8 @@ Tests for the ci_status metric.
 
 from oss_sustain_guard.metrics.base import MetricContext
 from oss_sustain_guard.metrics.ci_status import METRIC, check_ci_status
-from oss_sustain_guard.vcs.base import VCSRepositoryData
-
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+
+from ._fixtures import make_vcs_data
 
 
 class TestCiStatusMetric:
@@ -55,7 +13,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_archived_repository(self):
         """Test when repository is archived."""
-        vcs_data = _vcs_data(is_archived=True)
+        vcs_data = make_vcs_data(is_archived=True)
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 10
@@ -65,7 +23,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_skipped_without_data(self):
         """Test that CI status is skipped when no CI data is available."""
-        vcs_data = _vcs_data()
+        vcs_data = make_vcs_data()
         result = check_ci_status(vcs_data)
         assert result is not None
         assert result.name == "Build Health"
@@ -74,7 +32,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_no_default_branch(self):
         """Test when default branch is not available."""
-        vcs_data = _vcs_data(default_branch=None, raw_data={})
+        vcs_data = make_vcs_data(default_branch=None, raw_data={})
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 0
@@ -84,7 +42,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_no_target(self):
         """Test when default branch has no target."""
-        vcs_data = _vcs_data(raw_data={"defaultBranchRef": {}})
+        vcs_data = make_vcs_data(raw_data={"defaultBranchRef": {}})
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 0
@@ -94,7 +52,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_no_check_suites(self):
         """Test when no checkSuites data."""
-        vcs_data = _vcs_data(raw_data={"defaultBranchRef": {"target": {}}})
+        vcs_data = make_vcs_data(raw_data={"defaultBranchRef": {"target": {}}})
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 0
@@ -104,7 +62,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_empty_check_suites(self):
         """Test when checkSuites is empty."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             raw_data={"defaultBranchRef": {"target": {"checkSuites": {"nodes": []}}}}
         )
         result = check_ci_status(vcs_data)
@@ -116,7 +74,9 @@ class TestCiStatusMetric:
 
     def test_ci_status_success(self):
         """Test when CI status is SUCCESS."""
-        vcs_data = _vcs_data(ci_status={"conclusion": "SUCCESS", "status": "COMPLETED"})
+        vcs_data = make_vcs_data(
+            ci_status={"conclusion": "SUCCESS", "status": "COMPLETED"}
+        )
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 10
@@ -126,7 +86,9 @@ class TestCiStatusMetric:
 
     def test_ci_status_failure(self):
         """Test when CI status is FAILURE."""
-        vcs_data = _vcs_data(ci_status={"conclusion": "FAILURE", "status": "COMPLETED"})
+        vcs_data = make_vcs_data(
+            ci_status={"conclusion": "FAILURE", "status": "COMPLETED"}
+        )
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 0
@@ -136,7 +98,9 @@ class TestCiStatusMetric:
 
     def test_ci_status_in_progress(self):
         """Test when CI status is IN_PROGRESS."""
-        vcs_data = _vcs_data(ci_status={"conclusion": None, "status": "IN_PROGRESS"})
+        vcs_data = make_vcs_data(
+            ci_status={"conclusion": None, "status": "IN_PROGRESS"}
+        )
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 6
@@ -146,7 +110,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_queued(self):
         """Test when CI status is QUEUED."""
-        vcs_data = _vcs_data(ci_status={"conclusion": None, "status": "QUEUED"})
+        vcs_data = make_vcs_data(ci_status={"conclusion": None, "status": "QUEUED"})
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 6
@@ -156,7 +120,9 @@ class TestCiStatusMetric:
 
     def test_ci_status_skipped(self):
         """Test when CI status is SKIPPED."""
-        vcs_data = _vcs_data(ci_status={"conclusion": "SKIPPED", "status": "COMPLETED"})
+        vcs_data = make_vcs_data(
+            ci_status={"conclusion": "SKIPPED", "status": "COMPLETED"}
+        )
         result = check_ci_status(vcs_data)
         assert result.name == "Build Health"
         assert result.score == 6
@@ -166,7 +132,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_latest_suite_not_dict(self):
         """Test when latest check suite is not a dict."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             raw_data={
                 "defaultBranchRef": {"target": {"checkSuites": {"nodes": ["oops"]}}}
             }
@@ -178,7 +144,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_non_string_values(self):
         """Test when conclusion and status are not strings."""
-        vcs_data = _vcs_data(ci_status={"conclusion": 123, "status": 456})
+        vcs_data = make_vcs_data(ci_status={"conclusion": 123, "status": 456})
         result = check_ci_status(vcs_data)
         assert result.score == 6
         assert "Configured" in result.message
@@ -186,7 +152,9 @@ class TestCiStatusMetric:
 
     def test_ci_status_unknown_conclusion(self):
         """Test when CI status is unknown."""
-        vcs_data = _vcs_data(ci_status={"conclusion": "WEIRD", "status": "COMPLETED"})
+        vcs_data = make_vcs_data(
+            ci_status={"conclusion": "WEIRD", "status": "COMPLETED"}
+        )
         result = check_ci_status(vcs_data)
         assert result.score == 4
         assert "Unknown" in result.message
@@ -194,7 +162,7 @@ class TestCiStatusMetric:
 
     def test_ci_status_metric_spec_checker(self):
         """Test MetricSpec checker delegates to the metric function."""
-        repo_data = _vcs_data(is_archived=True)
+        repo_data = make_vcs_data(is_archived=True)
         context = MetricContext(owner="owner", name="repo", repo_url="url")
         result = METRIC.checker.check(repo_data, context)
         assert result is not None
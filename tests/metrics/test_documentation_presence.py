@@ -2,126 +2,78 @@
 Tests for the documentation_presence metric.
 """
 
+import pytest
+
 from oss_sustain_guard.metrics.documentation_presence import (
     check_documentation_presence,
 )
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+_README = {"readme_size": 1000}
+_CONTRIBUTING = {"contributing_file_size": 500}
+_WIKI = {"has_wiki": True}
+_HOMEPAGE = {"homepage_url": "https://example.com"}
+_DESCRIPTION = {"description": "A great project description"}
+
+# (signal overrides, score, risk, message) per documentation tier.
+_DOCUMENTATION_TIERS = (
+    (
+        {**_README, **_CONTRIBUTING, **_WIKI, **_HOMEPAGE, **_DESCRIPTION},
+        10,
+        "None",
+        "Excellent: 5/5 documentation signals present",
+    ),
+    (
+        {**_README, **_CONTRIBUTING, **_WIKI, **_DESCRIPTION},
+        10,
+        "None",
+        "Excellent: 4/5 documentation signals present",
+    ),
+    (
+        {**_README, **_CONTRIBUTING, **_HOMEPAGE},
+        7,
+        "Low",
+        "Good: 3/5 documentation signals present",
+    ),
+    (_README, 4, "Medium", "Basic: Only README detected"),
+)
 
 
 class TestDocumentationPresenceMetric:
     """Test the check_documentation_presence metric function."""
 
-    def test_documentation_all_present(self):
-        """Test when all documentation signals are present."""
-        vcs_data = _vcs_data(
-            readme_size=1000,
-            contributing_file_size=500,
-            has_wiki=True,
-            homepage_url="https://example.com",
-            description="A great project description",
-        )
-        result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent: 5/5 documentation signals present" in result.message
-        assert result.risk == "None"
-
-    def test_documentation_three_signals(self):
-        """Test with three documentation signals."""
-        vcs_data = _vcs_data(
-            readme_size=1000,
-            contributing_file_size=500,
-            has_wiki=True,
-            description="A great project description",
-        )
-        result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent: 4/5 documentation signals present" in result.message
-        assert result.risk == "None"
-
-    def test_documentation_readme_plus_two(self):
-        """Test with README and two other signals."""
-        vcs_data = _vcs_data(
-            readme_size=1000,
-            contributing_file_size=500,
-            homepage_url="https://example.com",
+    @pytest.mark.parametrize(
+        ("overrides", "score", "risk", "message"),
+        _DOCUMENTATION_TIERS,
+        ids=("all_present", "four_signals", "readme_plus_two", "readme_only"),
+    )
+    def test_documentation_tiers(self, overrides, score, risk, message):
+        """Test scoring tiers for increasing numbers of documentation signals."""
+        result = check_documentation_presence(make_vcs_data(**overrides))
+        assert_metric(
+            result,
+            score=score,
+            risk=risk,
+            contains=message,
+            name="Documentation Presence",
         )
-        result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 7
-        assert result.max_score == 10
-        assert "Good: 3/5 documentation signals present" in result.message
-        assert result.risk == "Low"
-
-    def test_documentation_readme_only(self):
-        """Test with only README present."""
-        vcs_data = _vcs_data(readme_size=1000)
-        result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Basic: Only README detected" in result.message
-        assert result.risk == "Medium"
 
-    def test_documentation_none(self):
+    def test_documentation_none(self, empty_vcs_data):
         """Test with no documentation."""
-        vcs_data = _vcs_data()
-        result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "No README or documentation found" in result.message
-        assert result.risk == "High"
+        result = check_documentation_presence(empty_vcs_data)
+        assert_metric(
+            result,
+            score=0,
+            risk="High",
+            contains="No README or documentation found",
+            name="Documentation Presence",
+        )
 
     def test_documentation_small_readme_symlink(self):
         """Test with small README that might be a symlink."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             raw_data={
                 "readmeUpperCase": {
                     "byteSize": 50,
@@ -130,8 +82,10 @@ class TestDocumentationPresenceMetric:
             }
         )
         result = check_documentation_presence(vcs_data)
-        assert result.name == "Documentation Presence"
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Basic: Only README detected" in result.message
-        assert result.risk == "Medium"
+        assert_metric(
+            result,
+            score=4,
+            risk="Medium",
+            contains="Basic: Only README detected",
+            name="Documentation Presence",
+        )
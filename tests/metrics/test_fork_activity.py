@@ -1,53 +1,21 @@
 """Tests for fork activity metric."""
 
 from datetime import datetime, timedelta, timezone
+from itertools import chain, repeat
+
+import pytest
 
-from oss_sustain_guard.metrics.base import MetricContext
 from oss_sustain_guard.metrics.fork_activity import METRIC, check_fork_activity
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+# The metric compares against the wall clock, so offsets are taken from import time.
+_NOW = datetime.now(timezone.utc)
+_ISO_20 = (_NOW - timedelta(days=20)).isoformat()
+_ISO_60 = (_NOW - timedelta(days=60)).isoformat()
+_ISO_400 = (_NOW - timedelta(days=400)).isoformat()
+_ISO_600 = (_NOW - timedelta(days=600)).isoformat()
 
 
 def _fork_edge(
@@ -69,165 +37,87 @@ def _fork_edge(
     return node
 
 
+class _RepeatedEdges:
+    """Sized, iterable view that repeats shared edges without building a list.
+
+    check_fork_activity only iterates the forks and takes their length.
+    """
+
+    def __init__(self, *runs: tuple[dict, int]):
+        self._runs = runs
+
+    def __len__(self) -> int:
+        return sum(count for _, count in self._runs)
+
+    def __iter__(self):
+        return chain.from_iterable(repeat(edge, count) for edge, count in self._runs)
+
+
+@pytest.fixture(scope="module")
+def fork_edges() -> tuple[dict, dict]:
+    """Return one active and one inactive fork edge shared by a module."""
+    active = _fork_edge(_ISO_60, _ISO_20, _ISO_20)
+    inactive = _fork_edge(_ISO_600, _ISO_400, _ISO_400)
+    return active, inactive
+
+
 class TestForkActivity:
     """Test fork activity metric."""
 
-    def test_no_forks(self):
+    def test_no_forks(self, empty_vcs_data):
         """Test with no forks."""
-        vcs_data = _vcs_data()
-        result = check_fork_activity(vcs_data)
+        result = check_fork_activity(empty_vcs_data)
         assert result.score == 0
         assert result.max_score == 10
         assert "No forks yet" in result.message
         assert result.risk == "Low"
 
-    def test_large_ecosystem_healthy(self):
-        """Test large ecosystem with healthy fork activity."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
-            total_forks=150,
-            forks=[
-                {
-                    "createdAt": (now - timedelta(days=60)).isoformat(),
-                    "pushedAt": (now - timedelta(days=30)).isoformat(),
-                    "defaultBranchRef": {
-                        "target": {
-                            "history": {
-                                "edges": [
-                                    {
-                                        "node": {
-                                            "committedDate": (
-                                                now - timedelta(days=30)
-                                            ).isoformat()
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    },
-                }
-            ]
-            * 3,
-        )
-        result = check_fork_activity(vcs_data)
-        assert result.score == 2
-        assert result.max_score == 10
-        assert "Needs attention" in result.message
-        assert result.risk == "Medium"
-
-    def test_large_ecosystem_high_divergence(self):
-        """Test large ecosystem with high fork divergence risk."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
-            total_forks=150,
-            forks=[
-                {
-                    "createdAt": (now - timedelta(days=60)).isoformat(),
-                    "pushedAt": (now - timedelta(days=30)).isoformat(),
-                    "defaultBranchRef": {
-                        "target": {
-                            "history": {
-                                "edges": [
-                                    {
-                                        "node": {
-                                            "committedDate": (
-                                                now - timedelta(days=30)
-                                            ).isoformat()
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    },
-                }
-            ]
-            * 10,
-        )
-        result = check_fork_activity(vcs_data)
-        assert result.score == 2
-        assert result.max_score == 10
-        assert "Needs attention" in result.message
-        assert result.risk == "Medium"
-
-    def test_medium_ecosystem_growing(self):
-        """Test medium ecosystem growing."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
-            total_forks=75,
-            forks=[
-                {
-                    "createdAt": (now - timedelta(days=60)).isoformat(),
-                    "pushedAt": (now - timedelta(days=30)).isoformat(),
-                    "defaultBranchRef": {
-                        "target": {
-                            "history": {
-                                "edges": [
-                                    {
-                                        "node": {
-                                            "committedDate": (
-                                                now - timedelta(days=30)
-                                            ).isoformat()
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    },
-                }
-            ]
-            * 4,
-        )
-        result = check_fork_activity(vcs_data)
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Monitor" in result.message
-        assert result.risk == "Low"
-
-    def test_small_ecosystem_emerging(self):
-        """Test small ecosystem with emerging interest."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
-            total_forks=15,
-            forks=[
-                {
-                    "createdAt": (now - timedelta(days=60)).isoformat(),
-                    "pushedAt": (now - timedelta(days=30)).isoformat(),
-                    "defaultBranchRef": {
-                        "target": {
-                            "history": {
-                                "edges": [
-                                    {
-                                        "node": {
-                                            "committedDate": (
-                                                now - timedelta(days=30)
-                                            ).isoformat()
-                                        }
-                                    }
-                                ]
-                            }
-                        }
-                    },
-                }
-            ]
-            * 2,
+    @pytest.mark.parametrize(
+        ("fork_count", "n_active", "n_inactive", "score", "message", "risk"),
+        [
+            (150, 3, 0, 2, "Needs attention", "Medium"),
+            (150, 10, 0, 2, "Needs attention", "Medium"),
+            (75, 4, 0, 4, "Monitor", "Low"),
+            (15, 2, 0, 6, "Moderate", "None"),
+            (120, 1, 9, 10, "Excellent", "None"),
+            (120, 3, 7, 6, "Monitor", "Low"),
+            (60, 2, 8, 8, "Good", "None"),
+        ],
+        ids=[
+            "large_all_active",
+            "large_high_divergence",
+            "medium_growing",
+            "small_emerging",
+            "large_low_active_ratio",
+            "large_moderate_ratio",
+            "medium_good_ratio",
+        ],
+    )
+    def test_ecosystem_size_and_active_ratio(
+        self, fork_edges, fork_count, n_active, n_inactive, score, message, risk
+    ):
+        """Test scoring across ecosystem sizes and active fork ratios."""
+        active, inactive = fork_edges
+        vcs_data = make_vcs_data(
+            total_forks=fork_count,
+            forks=_RepeatedEdges((active, n_active), (inactive, n_inactive)),
         )
         result = check_fork_activity(vcs_data)
-        assert result.score == 6
-        assert result.max_score == 10
-        assert "Moderate" in result.message
-        assert result.risk == "None"
+        assert_metric(result, score=score, risk=risk, contains=message)
 
     def test_very_small_ecosystem_limited(self):
         """Test very small ecosystem with limited activity."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             total_forks=3,
-            forks=[
-                {
-                    "createdAt": "2023-01-01T00:00:00Z",
-                    "pushedAt": "2023-01-01T00:00:00Z",
-                }
-            ]
-            * 3,
+            forks=_RepeatedEdges(
+                (
+                    {
+                        "createdAt": "2023-01-01T00:00:00Z",
+                        "pushedAt": "2023-01-01T00:00:00Z",
+                    },
+                    3,
+                )
+            ),
         )
         result = check_fork_activity(vcs_data)
         assert result.score == 2
@@ -235,72 +125,14 @@ class TestForkActivity:
         assert "Limited" in result.message
         assert result.risk == "Low"
 
-    def test_large_ecosystem_low_active_ratio(self):
-        """Test large ecosystem with low active fork ratio."""
-        now = datetime.now(timezone.utc)
-        active = _fork_edge(
-            (now - timedelta(days=60)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-        )
-        inactive = _fork_edge(
-            (now - timedelta(days=600)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-        )
-        vcs_data = _vcs_data(total_forks=120, forks=[active] + [inactive] * 9)
-        result = check_fork_activity(vcs_data)
-        assert result.score == 10
-        assert "Excellent" in result.message
-        assert result.risk == "None"
-
-    def test_large_ecosystem_moderate_ratio(self):
-        """Test large ecosystem with moderate active fork ratio."""
-        now = datetime.now(timezone.utc)
-        active = _fork_edge(
-            (now - timedelta(days=60)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-        )
-        inactive = _fork_edge(
-            (now - timedelta(days=600)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-        )
-        vcs_data = _vcs_data(total_forks=120, forks=[active] * 3 + [inactive] * 7)
-        result = check_fork_activity(vcs_data)
-        assert result.score == 6
-        assert "Monitor" in result.message
-        assert result.risk == "Low"
-
-    def test_medium_ecosystem_good_ratio(self):
-        """Test medium ecosystem with good active fork ratio."""
-        now = datetime.now(timezone.utc)
-        active = _fork_edge(
-            (now - timedelta(days=60)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-            (now - timedelta(days=20)).isoformat(),
-        )
-        inactive = _fork_edge(
-            (now - timedelta(days=600)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-            (now - timedelta(days=400)).isoformat(),
-        )
-        vcs_data = _vcs_data(total_forks=60, forks=[active] * 2 + [inactive] * 8)
-        result = check_fork_activity(vcs_data)
-        assert result.score == 8
-        assert "Good" in result.message
-        assert result.risk == "None"
-
     def test_small_ecosystem_fallback_push_date(self):
         """Test fallback to push date when default branch is missing."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             total_forks=12,
             forks=[
                 _fork_edge(
-                    (now - timedelta(days=60)).isoformat(),
-                    (now - timedelta(days=20)).isoformat(),
+                    _ISO_60,
+                    _ISO_20,
                     None,
                     include_branch=False,
                 )
@@ -313,14 +145,13 @@ class TestForkActivity:
 
     def test_very_small_ecosystem_active(self):
         """Test very small ecosystem with some activity."""
-        now = datetime.now(timezone.utc)
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             total_forks=5,
             forks=[
                 _fork_edge(
-                    (now - timedelta(days=60)).isoformat(),
-                    (now - timedelta(days=20)).isoformat(),
-                    (now - timedelta(days=20)).isoformat(),
+                    _ISO_60,
+                    _ISO_20,
+                    _ISO_20,
                 )
             ],
         )
@@ -331,7 +162,7 @@ class TestForkActivity:
 
     def test_fork_activity_invalid_dates(self):
         """Test handling of invalid fork timestamps."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             total_forks=5,
             forks=[_fork_edge("not-a-date", 123, None, include_branch=False)],
         )
@@ -340,11 +171,9 @@ class TestForkActivity:
         assert "Limited" in result.message
         assert result.risk == "Low"
 
-    def test_fork_activity_metric_spec_checker(self):
+    def test_fork_activity_metric_spec_checker(self, empty_vcs_data, metric_context):
         """Test MetricSpec checker delegates to the metric function."""
-        repo_data = _vcs_data()
-        context = MetricContext(owner="owner", name="repo", repo_url="url")
-        result = METRIC.checker.check(repo_data, context)
+        result = METRIC.checker.check(empty_vcs_data, metric_context)
         assert result is not None
         assert result.name == "Fork Activity"
 
@@ -2,51 +2,42 @@
 Tests for the funding metric.
 """
 
+from types import MappingProxyType
+
+import pytest
+
 from oss_sustain_guard.metrics.funding import check_funding, is_corporate_backed
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+# check_funding and is_corporate_backed only read their input, so share it.
+_ORG_MS = make_vcs_data(
+    owner_type="Organization",
+    owner_login="microsoft",
+    funding_links=["https://github.com/sponsors/microsoft"],
+)
+_ORG_GOOGLE_NO_LINKS = make_vcs_data(owner_type="Organization", owner_login="google")
+_USER_WITH_LINKS = make_vcs_data(
+    owner_type="User",
+    owner_login="johndoe",
+    funding_links=["https://github.com/sponsors/johndoe"],
+)
+_USER_NO_LINKS = make_vcs_data(owner_type="User", owner_login="johndoe")
+_EMPTY = MappingProxyType({})
+
+# (repository data, expected score, expected risk, expected message fragment)
+_FUNDING_CASES = (
+    (_ORG_MS, 10, "None", "Well-supported: microsoft organization + 1 funding link"),
+    (
+        _ORG_GOOGLE_NO_LINKS,
+        10,
+        "None",
+        "Well-supported: Organization maintained by google",
+    ),
+    (_USER_WITH_LINKS, 8, "None", "Community-funded: 1 funding link"),
+    (_USER_NO_LINKS, 0, "Low", "No funding sources detected"),
+)
 
 
 class TestFundingMetric:
@@ -54,73 +45,29 @@ class TestFundingMetric:
 
     def test_is_corporate_backed_organization(self):
         """Test detection of organization-owned repository."""
-        repo_data = _vcs_data(owner_type="Organization", owner_login="microsoft")
-        assert is_corporate_backed(repo_data) is True
+        assert is_corporate_backed(_ORG_MS) is True
 
     def test_is_corporate_backed_user(self):
         """Test detection of user-owned repository."""
-        repo_data = _vcs_data(owner_type="User", owner_login="johndoe")
-        assert is_corporate_backed(repo_data) is False
+        assert is_corporate_backed(_USER_NO_LINKS) is False
 
     def test_is_corporate_backed_no_owner(self):
         """Test when owner data is missing."""
-        repo_data = {}
-        assert is_corporate_backed(repo_data) is False
-
-    def test_funding_corporate_with_funding_links(self):
-        """Test corporate-backed repository with funding links."""
-        vcs_data = _vcs_data(
-            owner_type="Organization",
-            owner_login="microsoft",
-            funding_links=["https://github.com/sponsors/microsoft"],
-        )
-        result = check_funding(vcs_data)
-        assert result.name == "Funding Signals"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert (
-            "Well-supported: microsoft organization + 1 funding link" in result.message
-        )
-        assert result.risk == "None"
+        assert is_corporate_backed(_EMPTY) is False
 
-    def test_funding_corporate_without_funding_links(self):
-        """Test corporate-backed repository without funding links."""
-        vcs_data = _vcs_data(
-            owner_type="Organization",
-            owner_login="google",
-            funding_links=[],
-        )
-        result = check_funding(vcs_data)
-        assert result.name == "Funding Signals"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Well-supported: Organization maintained by google" in result.message
-        assert result.risk == "None"
-
-    def test_funding_community_with_funding_links(self):
-        """Test community-driven repository with funding links."""
-        vcs_data = _vcs_data(
-            owner_type="User",
-            owner_login="johndoe",
-            funding_links=["https://github.com/sponsors/johndoe"],
-        )
+    @pytest.mark.parametrize(
+        ("vcs_data", "score", "risk", "message"),
+        _FUNDING_CASES,
+        ids=(
+            "corporate_with_links",
+            "corporate_without_links",
+            "community_with_links",
+            "community_without_links",
+        ),
+    )
+    def test_funding(self, vcs_data, score, risk, message):
+        """Test scoring for corporate and community owners with and without links."""
         result = check_funding(vcs_data)
-        assert result.name == "Funding Signals"
-        assert result.score == 8
-        assert result.max_score == 10
-        assert "Community-funded: 1 funding link" in result.message
-        assert result.risk == "None"
-
-    def test_funding_community_without_funding_links(self):
-        """Test community-driven repository without funding links."""
-        vcs_data = _vcs_data(
-            owner_type="User",
-            owner_login="johndoe",
-            funding_links=[],
+        assert_metric(
+            result, score=score, risk=risk, contains=message, name="Funding Signals"
         )
-        result = check_funding(vcs_data)
-        assert result.name == "Funding Signals"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "No funding sources detected" in result.message
-        assert result.risk == "Low"
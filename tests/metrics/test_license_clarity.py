@@ -3,50 +3,8 @@ Tests for the license_clarity metric.
 """
 
 from oss_sustain_guard.metrics.license_clarity import check_license_clarity
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+from ._fixtures import make_vcs_data
 
 
 class TestLicenseClarityMetric:
@@ -54,7 +12,7 @@ class TestLicenseClarityMetric:
 
     def test_license_clarity_no_license(self):
         """Test when no license is detected."""
-        vcs_data = _vcs_data()
+        vcs_data = make_vcs_data()
         result = check_license_clarity(vcs_data)
         assert result.name == "License Clarity"
         assert result.score == 0
@@ -64,7 +22,7 @@ class TestLicenseClarityMetric:
 
     def test_license_clarity_osi_approved(self):
         """Test with OSI-approved license."""
-        vcs_data = _vcs_data(license_info={"name": "MIT License", "spdxId": "MIT"})
+        vcs_data = make_vcs_data(license_info={"name": "MIT License", "spdxId": "MIT"})
         result = check_license_clarity(vcs_data)
         assert result.name == "License Clarity"
         assert result.score == 10
@@ -74,7 +32,7 @@ class TestLicenseClarityMetric:
 
     def test_license_clarity_other_spdx(self):
         """Test with other SPDX license."""
-        vcs_data = _vcs_data(
+        vcs_data = make_vcs_data(
             license_info={"name": "Custom License", "spdxId": "LicenseRef-custom"}
         )
         result = check_license_clarity(vcs_data)
@@ -86,7 +44,7 @@ class TestLicenseClarityMetric:
 
     def test_license_clarity_no_spdx(self):
         """Test with license but no SPDX ID."""
-        vcs_data = _vcs_data(license_info={"name": "Unknown License"})
+        vcs_data = make_vcs_data(license_info={"name": "Unknown License"})
         result = check_license_clarity(vcs_data)
         assert result.name == "License Clarity"
         assert result.score == 4
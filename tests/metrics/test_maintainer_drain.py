@@ -2,53 +2,12 @@
 Tests for the maintainer_drain metric.
 """
 
-from datetime import datetime, timedelta, timezone
+from itertools import chain
 
 from oss_sustain_guard.metrics.maintainer_drain import check_maintainer_drain
 from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+from ._fixtures import make_vcs_data
 
 
 def _vcs_with_commits(
@@ -57,19 +16,35 @@ def _vcs_with_commits(
     default_branch: str | None = "main",
 ) -> VCSRepositoryData:
     commit_total = total_commits if total_commits is not None else len(commits)
-    return _vcs_data(
+    return make_vcs_data(
         commits=commits,
         total_commits=commit_total,
         default_branch=default_branch,
     )
 
 
+# The metric splits commits by position, so fixed dates are sufficient.
+_RECENT_ISO = "2024-01-01T00:00:00+00:00"
+_OLDER_ISO = "2023-06-15T00:00:00+00:00"
+
+# One prebuilt commit per user; tests only read them, so lists share references.
+_USER_COMMITS = tuple({"author": {"user": {"login": f"user{i}"}}} for i in range(10))
+_USER_COMMITS_RECENT = tuple(
+    {"authoredDate": _RECENT_ISO, "author": {"user": {"login": f"user{i}"}}}
+    for i in range(10)
+)
+_USER_COMMITS_OLDER = tuple(
+    {"authoredDate": _OLDER_ISO, "author": {"user": {"login": f"user{i}"}}}
+    for i in range(10)
+)
+
+
 class TestMaintainerDrainMetric:
     """Test the check_maintainer_drain metric function."""
 
     def test_maintainer_drain_no_default_branch(self):
         """Test when default branch is not available."""
-        vcs_data = _vcs_data(default_branch=None)
+        vcs_data = make_vcs_data(default_branch=None)
         result = check_maintainer_drain(vcs_data)
         assert result.name == "Maintainer Retention"
         assert result.score == 10
@@ -89,32 +64,13 @@ class TestMaintainerDrainMetric:
 
     def test_maintainer_drain_critical_drain(self):
         """Test with critical maintainer drain (90% reduction)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        older_date = now - timedelta(days=200)
-        # Create 50 commits: 25 recent with 1 contributor, 25 older with 10 contributors
-        recent_commits = [
-            {
-                "authoredDate": recent_date.isoformat(),
-                "author": {"user": {"login": "user1"}},
-            }
-        ] * 25
-        older_commits = []
-        for i in range(10):
-            older_commits.extend(
-                [
-                    {
-                        "authoredDate": older_date.isoformat(),
-                        "author": {"user": {"login": f"user{i}"}},
-                    }
-                ]
-                * 2
-            )
-        older_commits.extend(
-            [{"author": {"user": {"login": "user1"}}}] * 5
-        )  # Make 25 total
-
-        vcs_data = _vcs_with_commits(recent_commits + older_commits)
+        # 25 recent commits by 1 contributor, 25 older commits by 10 contributors
+        recent_commits = [_USER_COMMITS_RECENT[1]] * 25
+        older_commits = list(_USER_COMMITS_OLDER) * 2 + [_USER_COMMITS[1]] * 5
+
+        commits = recent_commits
+        commits.extend(older_commits)
+        vcs_data = _vcs_with_commits(commits)
         result = check_maintainer_drain(vcs_data)
         assert result.name == "Maintainer Retention"
         assert result.score == 0
@@ -124,53 +80,13 @@ class TestMaintainerDrainMetric:
 
     def test_maintainer_drain_high_drain(self):
         """Test with high maintainer drain (70% reduction)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        older_date = now - timedelta(days=200)
         # 3 recent contributors, 10 older
-        recent_commits = []
-        for i in range(3):
-            recent_commits.extend(
-                [
-                    {
-                        "authoredDate": recent_date.isoformat(),
-                        "author": {"user": {"login": f"user{i}"}},
-                    }
-                ]
-                * 8
-            )
-        recent_commits.extend(
-            [
-                {
-                    "authoredDate": recent_date.isoformat(),
-                    "author": {"user": {"login": "user0"}},
-                }
-            ]
-            * 1
-        )  # Make 25
-
-        older_commits = []
-        for i in range(10):
-            older_commits.extend(
-                [
-                    {
-                        "authoredDate": older_date.isoformat(),
-                        "author": {"user": {"login": f"user{i}"}},
-                    }
-                ]
-                * 2
-            )
-        older_commits.extend(
-            [
-                {
-                    "authoredDate": older_date.isoformat(),
-                    "author": {"user": {"login": "user0"}},
-                }
-            ]
-            * 5
-        )  # Make 25
-
-        vcs_data = _vcs_with_commits(recent_commits + older_commits)
+        recent_commits = list(_USER_COMMITS_RECENT[:3]) * 8 + [_USER_COMMITS_RECENT[0]]
+        older_commits = list(_USER_COMMITS_OLDER) * 2 + [_USER_COMMITS_OLDER[0]] * 5
+
+        commits = recent_commits
+        commits.extend(older_commits)
+        vcs_data = _vcs_with_commits(commits)
         result = check_maintainer_drain(vcs_data)
         assert result.name == "Maintainer Retention"
         assert result.score == 3
@@ -180,44 +96,15 @@ class TestMaintainerDrainMetric:
 
     def test_maintainer_drain_medium_drain(self):
         """Test with medium maintainer drain (50% reduction)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        older_date = now - timedelta(days=200)
         # 5 recent contributors, 10 older
-        recent_commits = []
-        for i in range(5):
-            recent_commits.extend(
-                [
-                    {
-                        "authoredDate": recent_date.isoformat(),
-                        "author": {"user": {"login": f"user{i}"}},
-                    }
-                ]
-                * 5
-            )
-
-        older_commits = []
-        for i in range(10):
-            older_commits.extend(
-                [
-                    {
-                        "authoredDate": older_date.isoformat(),
-                        "author": {"user": {"login": f"user{i}"}},
-                    }
-                ]
-                * 2
-            )
-        older_commits.extend(
-            [
-                {
-                    "authoredDate": older_date.isoformat(),
-                    "author": {"user": {"login": "user0"}},
-                }
-            ]
-            * 5
-        )  # Make 25
-
-        vcs_data = _vcs_with_commits(recent_commits + older_commits)
+        recent_commits = list(
+            chain.from_iterable([_USER_COMMITS_RECENT[i]] * 5 for i in range(5))
+        )
+        older_commits = list(_USER_COMMITS_OLDER) * 2 + [_USER_COMMITS_OLDER[0]] * 5
+
+        commits = recent_commits
+        commits.extend(older_commits)
+        vcs_data = _vcs_with_commits(commits)
         result = check_maintainer_drain(vcs_data)
         assert result.name == "Maintainer Retention"
         assert result.score == 5
@@ -228,17 +115,13 @@ class TestMaintainerDrainMetric:
     def test_maintainer_drain_stable(self):
         """Test with stable maintainer retention."""
         # 8 recent contributors, 8 older
-        recent_commits = []
-        for i in range(8):
-            recent_commits.extend([{"author": {"user": {"login": f"user{i}"}}}] * 3)
-        recent_commits.extend([{"author": {"user": {"login": "user0"}}}] * 1)  # Make 25
-
-        older_commits = []
-        for i in range(8):
-            older_commits.extend([{"author": {"user": {"login": f"user{i}"}}}] * 3)
-        older_commits.extend([{"author": {"user": {"login": "user0"}}}] * 1)  # Make 25
+        recent_commits = list(
+            chain.from_iterable([_USER_COMMITS[i]] * 3 for i in range(8))
+        )
+        recent_commits.append(_USER_COMMITS[0])  # Make 25
 
-        vcs_data = _vcs_with_commits(recent_commits + older_commits)
+        # Both halves are identical, so repeat the recent block.
+        vcs_data = _vcs_with_commits(recent_commits * 2)
         result = check_maintainer_drain(vcs_data)
         assert result.name == "Maintainer Retention"
         assert result.score == 10
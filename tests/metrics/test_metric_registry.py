@@ -2,21 +2,15 @@
 Tests for metric registry helpers.
 """
 
+from collections import namedtuple
 from types import SimpleNamespace
 
 from oss_sustain_guard import metrics
 from oss_sustain_guard.metrics.base import Metric, MetricContext, MetricSpec
 from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-class DummyEntryPoint:
-    """Simple stand-in for importlib.metadata.EntryPoint."""
-
-    def __init__(self, value):
-        self._value = value
-
-    def load(self):
-        return self._value
+# Stand-in for importlib.metadata.EntryPoint; ``load`` is the stored callable.
+DummyEntryPoint = namedtuple("DummyEntryPoint", ["load"])
 
 
 def _spec(name: str) -> MetricSpec:
@@ -54,10 +48,10 @@ def test_load_entrypoint_metric_specs_handles_factories(monkeypatch):
         return spec_factory
 
     entrypoints = [
-        DummyEntryPoint(spec_direct),
-        DummyEntryPoint(factory),
-        DummyEntryPoint("not a spec"),
-        DummyEntryPoint(lambda: "nope"),
+        DummyEntryPoint(load=lambda: spec_direct),
+        DummyEntryPoint(load=lambda: factory),
+        DummyEntryPoint(load=lambda: "not a spec"),
+        DummyEntryPoint(load=lambda: lambda: "nope"),
     ]
     monkeypatch.setattr(metrics, "entry_points", lambda group: entrypoints)
 
@@ -1,50 +1,19 @@
 """Tests for PR acceptance ratio metric."""
 
+import pytest
+
 from oss_sustain_guard.metrics.pr_acceptance_ratio import check_pr_acceptance_ratio
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+# (merged count, closed-without-merge count, score, risk, message fragment)
+_ACCEPTANCE_TIERS = (
+    (80, 20, 10, "None", "Excellent"),
+    (70, 30, 7, "Low", "Good"),
+    (50, 50, 4, "Medium", "Moderate"),
+    (30, 70, 0, "Medium", "Observe"),
+)
 
 
 class TestPrAcceptanceRatio:
@@ -52,49 +21,24 @@ class TestPrAcceptanceRatio:
 
     def test_no_resolved_prs(self):
         """Test with no resolved PRs."""
-        vcs_data = _vcs_data(total_merged_prs=0, closed_prs=[])
+        vcs_data = make_vcs_data(total_merged_prs=0, closed_prs=[])
         result = check_pr_acceptance_ratio(vcs_data)
         assert result.score == 5
         assert result.max_score == 10
         assert "No resolved pull requests" in result.message
         assert result.risk == "None"
 
-    def test_very_welcoming(self):
-        """Test very welcoming acceptance rate."""
-        closed_prs = [{"merged": False} for _ in range(20)]
-        vcs_data = _vcs_data(total_merged_prs=80, closed_prs=closed_prs)
-        result = check_pr_acceptance_ratio(vcs_data)
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent" in result.message
-        assert result.risk == "None"
-
-    def test_good_acceptance(self):
-        """Test good acceptance rate."""
-        closed_prs = [{"merged": False} for _ in range(30)]
-        vcs_data = _vcs_data(total_merged_prs=70, closed_prs=closed_prs)
-        result = check_pr_acceptance_ratio(vcs_data)
-        assert result.score == 7
-        assert result.max_score == 10
-        assert "Good" in result.message
-        assert result.risk == "Low"
-
-    def test_moderate_acceptance(self):
-        """Test moderate acceptance rate."""
-        closed_prs = [{"merged": False} for _ in range(50)]
-        vcs_data = _vcs_data(total_merged_prs=50, closed_prs=closed_prs)
-        result = check_pr_acceptance_ratio(vcs_data)
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Moderate" in result.message
-        assert result.risk == "Medium"
-
-    def test_needs_attention(self):
-        """Test low acceptance rate that needs attention."""
-        closed_prs = [{"merged": False} for _ in range(70)]
-        vcs_data = _vcs_data(total_merged_prs=30, closed_prs=closed_prs)
+    @pytest.mark.parametrize(
+        ("merged", "closed", "score", "risk", "message"),
+        _ACCEPTANCE_TIERS,
+        ids=("very_welcoming", "good", "moderate", "needs_attention"),
+    )
+    def test_acceptance_tiers(
+        self, unmerged_closed_prs, merged, closed, score, risk, message
+    ):
+        """Test scoring tiers for decreasing acceptance rates."""
+        vcs_data = make_vcs_data(
+            total_merged_prs=merged, closed_prs=unmerged_closed_prs[:closed]
+        )
         result = check_pr_acceptance_ratio(vcs_data)
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "Observe" in result.message
-        assert result.risk == "Medium"
+        assert_metric(result, score=score, risk=risk, contains=message)
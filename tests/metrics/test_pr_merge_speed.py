@@ -2,51 +2,31 @@
 
 from datetime import datetime, timedelta
 
+import pytest
+
 from oss_sustain_guard.metrics.pr_merge_speed import check_pr_merge_speed
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+# Only merge durations matter, so every PR is opened at a fixed time.
+_BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+_BASE_ISO = _BASE_TIME.isoformat()
+_DAY = timedelta(days=1)
+
+# Merged PRs keyed by days-to-merge, formatted once at import.
+_PR_BY_DAYS = {
+    days: {"createdAt": _BASE_ISO, "mergedAt": (_BASE_TIME + _DAY * days).isoformat()}
+    for days in (1, 2, 4, 5, 14, 16, 45, 50)
+}
+
+# (days-to-merge of each PR, expected score, expected risk, message fragment)
+_MERGE_SPEED_TIERS = (
+    ((1, 2), 10, "None", "Excellent"),
+    ((4, 5), 8, "Low", "Good"),
+    ((14, 16), 4, "Medium", "Moderate"),
+    ((45, 50), 2, "High", "Observe"),
+)
 
 
 class TestPrMergeSpeed:
@@ -54,85 +34,20 @@ class TestPrMergeSpeed:
 
     def test_no_merged_prs(self):
         """Test with no merged PRs."""
-        vcs_data = _vcs_data(merged_prs=[])
+        vcs_data = make_vcs_data(merged_prs=[])
         result = check_pr_merge_speed(vcs_data)
         assert result.score == 5
         assert result.max_score == 10
         assert "No merged PRs available" in result.message
         assert result.risk == "None"
 
-    def test_excellent_merge_speed(self):
-        """Test excellent merge speed (<3 days)."""
-        base_time = datetime.now()
-        merged_prs = [
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=1)).isoformat(),
-            },
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=2)).isoformat(),
-            },
-        ]
-        result = check_pr_merge_speed(_vcs_data(merged_prs=merged_prs))
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent" in result.message
-        assert result.risk == "None"
-
-    def test_good_merge_speed(self):
-        """Test good merge speed (3-7 days)."""
-        base_time = datetime.now()
-        merged_prs = [
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=4)).isoformat(),
-            },
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=5)).isoformat(),
-            },
-        ]
-        result = check_pr_merge_speed(_vcs_data(merged_prs=merged_prs))
-        assert result.score == 8
-        assert result.max_score == 10
-        assert "Good" in result.message
-        assert result.risk == "Low"
-
-    def test_moderate_merge_speed(self):
-        """Test moderate merge speed (7-30 days)."""
-        base_time = datetime.now()
-        merged_prs = [
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=14)).isoformat(),
-            },
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=16)).isoformat(),
-            },
-        ]
-        result = check_pr_merge_speed(_vcs_data(merged_prs=merged_prs))
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Moderate" in result.message
-        assert result.risk == "Medium"
-
-    def test_slow_merge_speed(self):
-        """Test slow merge speed (>30 days)."""
-        base_time = datetime.now()
-        merged_prs = [
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=45)).isoformat(),
-            },
-            {
-                "createdAt": base_time.isoformat(),
-                "mergedAt": (base_time + timedelta(days=50)).isoformat(),
-            },
-        ]
-        result = check_pr_merge_speed(_vcs_data(merged_prs=merged_prs))
-        assert result.score == 2
-        assert result.max_score == 10
-        assert "Observe" in result.message
-        assert result.risk == "High"
+    @pytest.mark.parametrize(
+        ("merge_days", "score", "risk", "message"),
+        _MERGE_SPEED_TIERS,
+        ids=("excellent", "good", "moderate", "slow"),
+    )
+    def test_merge_speed_tiers(self, merge_days, score, risk, message):
+        """Test scoring tiers for increasing median merge times."""
+        merged_prs = [_PR_BY_DAYS[days] for days in merge_days]
+        result = check_pr_merge_speed(make_vcs_data(merged_prs=merged_prs))
+        assert_metric(result, score=score, risk=risk, contains=message)
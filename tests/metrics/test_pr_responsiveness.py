@@ -4,51 +4,34 @@ Tests for the pr_responsiveness metric.
 
 from datetime import datetime, timedelta
 
+import pytest
+
 from oss_sustain_guard.metrics.pr_responsiveness import check_pr_responsiveness
 from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
+
+# Only response delays matter, so every PR is opened at a fixed time.
+_BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+_BASE_ISO = _BASE_TIME.isoformat() + "Z"
+_HOUR = timedelta(hours=1)
+_DAY = timedelta(days=1)
+
+# (first response delay, expected score, expected risk, message fragment)
+_RESPONSE_TIERS = (
+    (_HOUR * 12, 10, "None", "Excellent: Avg PR first response 12.0h"),
+    (_DAY * 3, 6, "Low", "Good: Avg PR first response 3.0d"),
+    (_DAY * 10, 0, "Medium", "Observe: Avg PR first response 10.0d"),
+)
+
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
+def _responsiveness_repo(response_delta: timedelta) -> VCSRepositoryData:
+    """Build repository data with one PR first reviewed after ``response_delta``."""
+    response_iso = (_BASE_TIME + response_delta).isoformat() + "Z"
+    return make_vcs_data(
+        closed_prs=[{"createdAt": _BASE_ISO, "reviews": [{"createdAt": response_iso}]}]
     )
-    return data._replace(**overrides)
 
 
 class TestPrResponsivenessMetric:
@@ -56,7 +39,7 @@ class TestPrResponsivenessMetric:
 
     def test_pr_responsiveness_no_closed_prs(self):
         """Test when no closed PRs are available."""
-        vcs_data = _vcs_data(closed_prs=[])
+        vcs_data = make_vcs_data(closed_prs=[])
         result = check_pr_responsiveness(vcs_data)
         assert result.name == "PR Responsiveness"
         assert result.score == 5
@@ -66,67 +49,31 @@ class TestPrResponsivenessMetric:
 
     def test_pr_responsiveness_no_response_times(self):
         """Test when PRs exist but no response times can be measured."""
-        created_at = datetime.now()
         closed_prs = [
             {
-                "createdAt": created_at.isoformat() + "Z",
+                "createdAt": _BASE_ISO,
                 "reviews": [],
             }
         ]
-        result = check_pr_responsiveness(_vcs_data(closed_prs=closed_prs))
+        result = check_pr_responsiveness(make_vcs_data(closed_prs=closed_prs))
         assert result.name == "PR Responsiveness"
         assert result.score == 2
         assert result.max_score == 10
         assert "Unable to measure PR response times" in result.message
         assert result.risk == "None"
 
-    def test_pr_responsiveness_excellent(self):
-        """Test with excellent responsiveness (<24h)."""
-        created_at = datetime.now()
-        response_at = created_at + timedelta(hours=12)
-        closed_prs = [
-            {
-                "createdAt": created_at.isoformat() + "Z",
-                "reviews": [{"createdAt": response_at.isoformat() + "Z"}],
-            }
-        ]
-        result = check_pr_responsiveness(_vcs_data(closed_prs=closed_prs))
-        assert result.name == "PR Responsiveness"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent: Avg PR first response 12.0h" in result.message
-        assert result.risk == "None"
-
-    def test_pr_responsiveness_good(self):
-        """Test with good responsiveness (<7d)."""
-        created_at = datetime.now()
-        response_at = created_at + timedelta(days=3)
-        closed_prs = [
-            {
-                "createdAt": created_at.isoformat() + "Z",
-                "reviews": [{"createdAt": response_at.isoformat() + "Z"}],
-            }
-        ]
-        result = check_pr_responsiveness(_vcs_data(closed_prs=closed_prs))
-        assert result.name == "PR Responsiveness"
-        assert result.score == 6
-        assert result.max_score == 10
-        assert "Good: Avg PR first response 3.0d" in result.message
-        assert result.risk == "Low"
-
-    def test_pr_responsiveness_poor(self):
-        """Test with poor responsiveness (>7d)."""
-        created_at = datetime.now()
-        response_at = created_at + timedelta(days=10)
-        closed_prs = [
-            {
-                "createdAt": created_at.isoformat() + "Z",
-                "reviews": [{"createdAt": response_at.isoformat() + "Z"}],
-            }
-        ]
-        result = check_pr_responsiveness(_vcs_data(closed_prs=closed_prs))
-        assert result.name == "PR Responsiveness"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "Observe: Avg PR first response 10.0d" in result.message
-        assert result.risk == "Medium"
+    @pytest.mark.parametrize(
+        ("response_delta", "score", "risk", "message"),
+        _RESPONSE_TIERS,
+        ids=("excellent", "good", "poor"),
+    )
+    def test_pr_responsiveness_tiers(self, response_delta, score, risk, message):
+        """Test scoring tiers for increasing first-response delays."""
+        result = check_pr_responsiveness(_responsiveness_repo(response_delta))
+        assert_metric(
+            result,
+            score=score,
+            risk=risk,
+            contains=message,
+            name="PR Responsiveness",
+        )
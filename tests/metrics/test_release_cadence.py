@@ -2,53 +2,31 @@
 Tests for the release_cadence metric.
 """
 
-from datetime import datetime, timedelta
+import pytest
 
 from oss_sustain_guard.metrics.release_cadence import check_release_cadence
 from oss_sustain_guard.vcs.base import VCSRepositoryData
 
+from ._fixtures import make_vcs_data
+from ._helpers import assert_metric
 
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+# The checker reads the clock, so every test runs against FROZEN_NOW
+# (2024-01-01 UTC).
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+# (latest release date, expected score, expected risk, message fragment);
+# releases are 30, 120, 240 and 400 days before the frozen clock.
+_CADENCE_TIERS = (
+    ("2023-12-02T00:00:00+00:00", 10, "None", "Active: Last release"),
+    ("2023-09-03T00:00:00+00:00", 7, "Low", "Moderate: Last release"),
+    ("2023-05-06T00:00:00+00:00", 4, "Medium", "Slow: Last release"),
+    ("2022-11-27T00:00:00+00:00", 0, "High", "Observe: Last release"),
+)
+
+
+def _release_repo(published_at: str) -> VCSRepositoryData:
+    """Build repository data whose only release was published at ``published_at``."""
+    return make_vcs_data(releases=[{"publishedAt": published_at, "tagName": "v1.0.0"}])
 
 
 class TestReleaseCadenceMetric:
@@ -56,7 +34,7 @@ class TestReleaseCadenceMetric:
 
     def test_release_cadence_archived(self):
         """Test when repository is archived."""
-        vcs_data = _vcs_data(is_archived=True)
+        vcs_data = make_vcs_data(is_archived=True)
         result = check_release_cadence(vcs_data)
         assert result.name == "Release Rhythm"
         assert result.score == 10
@@ -66,7 +44,7 @@ class TestReleaseCadenceMetric:
 
     def test_release_cadence_no_releases(self):
         """Test when no releases are found."""
-        vcs_data = _vcs_data()
+        vcs_data = make_vcs_data()
         result = check_release_cadence(vcs_data)
         assert result.name == "Release Rhythm"
         assert result.score == 0
@@ -74,74 +52,18 @@ class TestReleaseCadenceMetric:
         assert "No releases found" in result.message
         assert result.risk == "High"
 
-    def test_release_cadence_active(self):
-        """Test with recent release (<3 months)."""
-        recent_date = datetime.now() - timedelta(days=30)
-        vcs_data = _vcs_data(
-            releases=[
-                {
-                    "publishedAt": recent_date.isoformat() + "Z",
-                    "tagName": "v1.0.0",
-                }
-            ]
-        )
-        result = check_release_cadence(vcs_data)
-        assert result.name == "Release Rhythm"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Active: Last release" in result.message
-        assert result.risk == "None"
-
-    def test_release_cadence_moderate(self):
-        """Test with moderate release (3-6 months)."""
-        moderate_date = datetime.now() - timedelta(days=120)
-        vcs_data = _vcs_data(
-            releases=[
-                {
-                    "publishedAt": moderate_date.isoformat() + "Z",
-                    "tagName": "v1.0.0",
-                }
-            ]
-        )
-        result = check_release_cadence(vcs_data)
-        assert result.name == "Release Rhythm"
-        assert result.score == 7
-        assert result.max_score == 10
-        assert "Moderate: Last release" in result.message
-        assert result.risk == "Low"
-
-    def test_release_cadence_slow(self):
-        """Test with slow release (6-12 months)."""
-        slow_date = datetime.now() - timedelta(days=240)
-        vcs_data = _vcs_data(
-            releases=[
-                {
-                    "publishedAt": slow_date.isoformat() + "Z",
-                    "tagName": "v1.0.0",
-                }
-            ]
-        )
-        result = check_release_cadence(vcs_data)
-        assert result.name == "Release Rhythm"
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Slow: Last release" in result.message
-        assert result.risk == "Medium"
-
-    def test_release_cadence_abandoned(self):
-        """Test with old release (>12 months)."""
-        old_date = datetime.now() - timedelta(days=400)
-        vcs_data = _vcs_data(
-            releases=[
-                {
-                    "publishedAt": old_date.isoformat() + "Z",
-                    "tagName": "v1.0.0",
-                }
-            ]
+    @pytest.mark.parametrize(
+        ("published_at", "score", "risk", "message"),
+        _CADENCE_TIERS,
+        ids=("active", "moderate", "slow", "abandoned"),
+    )
+    def test_release_cadence_tiers(self, published_at, score, risk, message):
+        """Test scoring tiers for increasingly old latest releases."""
+        result = check_release_cadence(_release_repo(published_at))
+        assert_metric(
+            result,
+            score=score,
+            risk=risk,
+            prefix=message,
+            name="Release Rhythm",
         )
-        result = check_release_cadence(vcs_data)
-        assert result.name == "Release Rhythm"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "Observe: Last release" in result.message
-        assert result.risk == "High"
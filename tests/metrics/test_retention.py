@@ -2,53 +2,51 @@
 Tests for the retention metric.
 """
 
-from datetime import datetime, timedelta, timezone
+import pytest
 
 from oss_sustain_guard.metrics.retention import check_retention
-from oss_sustain_guard.vcs.base import VCSRepositoryData
 
-
-def _vcs_data(**overrides) -> VCSRepositoryData:
-    data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at=None,
-        owner_type="User",
-        owner_login="owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch="main",
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[],
-        total_commits=0,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data=None,
-    )
-    return data._replace(**overrides)
+from ._fixtures import make_commit, make_vcs_data
+from ._helpers import assert_metric
+
+# The checker reads the clock, so every test runs against FROZEN_NOW
+# (2024-01-01 UTC); commit dates are 30 and 120 days before it.
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+_RECENT_ISO = "2023-12-02T00:00:00+00:00"
+_EARLIER_ISO = "2023-09-03T00:00:00+00:00"
+
+# (recent authors, earlier authors, expected score, expected risk, message)
+_RETENTION_TIERS = (
+    (
+        ("user1", "user2", "user3"),
+        ("user1", "user2", "user3"),
+        10,
+        "None",
+        "Excellent: 100% contributor retention",
+    ),
+    (
+        ("user1", "user2"),
+        ("user1", "user2", "user3"),
+        7,
+        "Low",
+        "Good: 67% contributor retention",
+    ),
+    (
+        ("user1",),
+        ("user1", "user2"),
+        4,
+        "Medium",
+        "Moderate: 50% contributor retention",
+    ),
+    (
+        ("user1",),
+        ("user1", "user2", "user3", "user4"),
+        0,
+        "High",
+        "Needs attention: 25% contributor retention",
+    ),
+)
 
 
 class TestRetentionMetric:
@@ -56,7 +54,7 @@ class TestRetentionMetric:
 
     def test_retention_no_default_branch(self):
         """Test when default branch is not available."""
-        vcs_data = _vcs_data(default_branch=None, commits=[])
+        vcs_data = make_vcs_data(default_branch=None, commits=[])
         result = check_retention(vcs_data)
         assert result.name == "Contributor Retention"
         assert result.score == 5
@@ -66,7 +64,7 @@ class TestRetentionMetric:
 
     def test_retention_no_history(self):
         """Test when no commit history is available."""
-        vcs_data = _vcs_data(commits=[])
+        vcs_data = make_vcs_data(commits=[])
         result = check_retention(vcs_data)
         assert result.name == "Contributor Retention"
         assert result.score == 5
@@ -76,154 +74,28 @@ class TestRetentionMetric:
 
     def test_retention_new_project(self):
         """Test for new project with no earlier contributors."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-        ]
-        result = check_retention(_vcs_data(commits=commits))
+        commits = [make_commit("user1", _RECENT_ISO)]
+        result = check_retention(make_vcs_data(commits=commits))
         assert result.name == "Contributor Retention"
         assert result.score == 10
         assert result.max_score == 10
         assert "New project: Not enough history to assess retention" in result.message
         assert result.risk == "None"
 
-    def test_retention_excellent(self):
-        """Test with excellent retention (80%+)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        earlier_date = now - timedelta(days=120)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-        ]
-        result = check_retention(_vcs_data(commits=commits))
-        assert result.name == "Contributor Retention"
-        assert result.score == 10
-        assert result.max_score == 10
-        assert "Excellent: 100% contributor retention" in result.message
-        assert result.risk == "None"
-
-    def test_retention_good(self):
-        """Test with good retention (60-79%)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        earlier_date = now - timedelta(days=120)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-        ]
-        result = check_retention(_vcs_data(commits=commits))
-        assert result.name == "Contributor Retention"
-        assert result.score == 7
-        assert result.max_score == 10
-        assert "Good: 67% contributor retention" in result.message
-        assert result.risk == "Low"
-
-    def test_retention_moderate(self):
-        """Test with moderate retention (40-59%)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        earlier_date = now - timedelta(days=120)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-        ]
-        result = check_retention(_vcs_data(commits=commits))
-        assert result.name == "Contributor Retention"
-        assert result.score == 4
-        assert result.max_score == 10
-        assert "Moderate: 50% contributor retention" in result.message
-        assert result.risk == "Medium"
-
-    def test_retention_poor(self):
-        """Test with poor retention (<40%)."""
-        now = datetime.now(timezone.utc)
-        recent_date = now - timedelta(days=30)
-        earlier_date = now - timedelta(days=120)
-
-        commits = [
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": recent_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user1"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user2"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user3"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-            {
-                "author": {"user": {"login": "user4"}},
-                "authoredDate": earlier_date.isoformat(),
-            },
-        ]
-        result = check_retention(_vcs_data(commits=commits))
-        assert result.name == "Contributor Retention"
-        assert result.score == 0
-        assert result.max_score == 10
-        assert "Needs attention: 25% contributor retention" in result.message
-        assert result.risk == "High"
+    @pytest.mark.parametrize(
+        ("recent_logins", "earlier_logins", "score", "risk", "message"),
+        _RETENTION_TIERS,
+        ids=("excellent_100", "good_67", "moderate_50", "poor_25"),
+    )
+    def test_retention_tiers(self, recent_logins, earlier_logins, score, risk, message):
+        """Test scoring tiers for shrinking shares of returning contributors."""
+        commits = [make_commit(login, _RECENT_ISO) for login in recent_logins]
+        commits.extend(make_commit(login, _EARLIER_ISO) for login in earlier_logins)
+        result = check_retention(make_vcs_data(commits=commits))
+        assert_metric(
+            result,
+            score=score,
+            risk=risk,
+            contains=message,
+            name="Contributor Retention",
+        )
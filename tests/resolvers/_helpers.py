@@ -0,0 +1,23 @@
+"""
+Helpers shared by resolver tests.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+
+def make_response(
+    status_code: int = 200, *, json: Any = None, text: str = ""
+) -> SimpleNamespace:
+    """
+    Build a stand-in for ``httpx.Response`` to return from a patched ``get``.
+
+    Only the attributes resolvers read are provided; ``raise_for_status`` is a
+    no-op, so pass a 404 only to resolvers that check ``status_code`` first.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        json=lambda: json,
+        raise_for_status=lambda: None,
+    )
@@ -0,0 +1,145 @@
+"""
+Shared fixtures for resolver tests.
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_get(monkeypatch) -> AsyncMock:
+    """Replace ``httpx.AsyncClient.get`` with an ``AsyncMock`` for one test."""
+    mock = AsyncMock()
+    monkeypatch.setattr(httpx.AsyncClient, "get", mock)
+    return mock
+
+
+def _raise_read_error(*_args, **_kwargs):
+    raise OSError("read error")
+
+
+@pytest.fixture
+def failing_read_text(monkeypatch) -> None:
+    """Make every ``Path.read_text`` call raise ``OSError`` for one test."""
+    monkeypatch.setattr(Path, "read_text", _raise_read_error)
+
+
+# Read-only manifests and lockfiles shared by resolver tests, keyed by file name.
+_SHARED_FILES = {
+    "pubspec.lock": (
+        "sdks:\n"
+        "  dart: '>=2.19.0'\n"
+        "packages:\n"
+        "  http:\n"
+        '    dependency: "direct main"\n'
+        "  path:\n"
+        "    dependency: transitive\n"
+        "environment:\n"
+        "  sdk: '>=2.19.0'\n"
+    ),
+    "pubspec.yaml": (
+        "name: example\n"
+        "dependencies:\n"
+        "  http: ^0.13.0\n"
+        "  path: any\n"
+        "dev_dependencies:\n"
+        "  lints: ^2.1.0\n"
+    ),
+    "mix.lock": (
+        '%{"phoenix": {:hex, :phoenix, "1.7.0"}, "ecto": {:hex, :ecto, "3.10"}}'
+    ),
+    "mix.exs": (
+        "defmodule Example.MixProject do\n"
+        "defp deps do\n"
+        "  [\n"
+        '    {:phoenix, "~> 1.7"},\n'
+        '    {:ecto_sql, "~> 3.10"}\n'
+        "  ]\n"
+        "end\n"
+    ),
+    "go.sum": (
+        "github.com/golang/go v1.21.0 h1:someHash\n"
+        "github.com/sirupsen/logrus v1.9.0 h1:anotherHash\n"
+        "golang.org/x/sys v0.10.0 h1:yetAnotherHash\n"
+    ),
+    "go.mod": (
+        "module github.com/example/project\n"
+        "go 1.21\n"
+        "require (\n"
+        "  github.com/user/repo v1.2.3\n"
+        "  // comment\n"
+        "  github.com/other/repo v0.1.0\n"
+        ")\n"
+        "require github.com/single/repo v0.9.0\n"
+    ),
+    "cpanfile.snapshot": (
+        "DISTRIBUTIONS\n"
+        "  distribution: Mojolicious-9.33\n"
+        "  distribution: Test-Simple-1.302190\n"
+    ),
+    "cpanfile": "requires 'Mojolicious', '9.00';\nrequires \"DBI\";\n",
+}
+
+
+@pytest.fixture(scope="session")
+def shared_files_dir(tmp_path_factory) -> Path:
+    """
+    Directory holding every file in ``_SHARED_FILES``, written once per session.
+
+    Tests must only read these files; anything that writes uses ``tmp_path``.
+    """
+    directory = tmp_path_factory.mktemp("resolvers", numbered=False)
+    for name, content in _SHARED_FILES.items():
+        (directory / name).write_text(content)
+    return directory
+
+
+@pytest.fixture
+def pubspec_lock(shared_files_dir) -> Path:
+    """pubspec.lock with one direct and one transitive package."""
+    return shared_files_dir / "pubspec.lock"
+
+
+@pytest.fixture
+def pubspec_yaml(shared_files_dir) -> Path:
+    """pubspec.yaml with regular and dev dependencies."""
+    return shared_files_dir / "pubspec.yaml"
+
+
+@pytest.fixture
+def mix_lock(shared_files_dir) -> Path:
+    """mix.lock with two Hex packages."""
+    return shared_files_dir / "mix.lock"
+
+
+@pytest.fixture
+def mix_exs(shared_files_dir) -> Path:
+    """mix.exs declaring two dependencies."""
+    return shared_files_dir / "mix.exs"
+
+
+@pytest.fixture
+def go_sum(shared_files_dir) -> Path:
+    """go.sum with three module checksums."""
+    return shared_files_dir / "go.sum"
+
+
+@pytest.fixture
+def go_mod(shared_files_dir) -> Path:
+    """go.mod with block and single-line requires."""
+    return shared_files_dir / "go.mod"
+
+
+@pytest.fixture
+def cpanfile_snapshot(shared_files_dir) -> Path:
+    """cpanfile.snapshot with two distributions."""
+    return shared_files_dir / "cpanfile.snapshot"
+
+
+@pytest.fixture
+def cpanfile(shared_files_dir) -> Path:
+    """cpanfile requiring two modules with both quote styles."""
+    return shared_files_dir / "cpanfile"
@@ -2,12 +2,46 @@
 Tests for C# resolver.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
+import httpx
 import pytest
 
 from oss_sustain_guard.resolvers.csharp import CSharpResolver
 
+from ._helpers import make_response
+
+
+class _FakeAsyncClient:
+    """Async HTTP client stand-in that replays queued responses in order."""
+
+    def __init__(self):
+        self.responses: list = []
+
+    async def get(self, *args, **kwargs):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture(scope="class")
+def _shared_http_client():
+    """Create one fake HTTP client per test class."""
+    return _FakeAsyncClient()
+
+
+@pytest.fixture
+def fake_http_client(_shared_http_client, monkeypatch):
+    """Route the C# resolver's HTTP client lookup to the shared fake client."""
+
+    async def _get_client():
+        return _shared_http_client
+
+    _shared_http_client.responses = []
+    monkeypatch.setattr(
+        "oss_sustain_guard.resolvers.csharp._get_async_http_client", _get_client
+    )
+    return _shared_http_client
+
 
 class TestCSharpResolver:
     """Test CSharpResolver class."""
@@ -26,95 +60,58 @@ class TestCSharpResolver:
         assert "packages.config" in manifests
         assert "packages.lock.json" in manifests
 
-    @patch("oss_sustain_guard.resolvers.csharp._get_async_http_client")
-    async def test_resolve_github_url_success(self, mock_get_client):
+    async def test_resolve_github_url_success(self, fake_http_client):
         """Test resolving GitHub URL from NuGet."""
-        mock_client_inst = MagicMock()
-        mock_get_client.return_value = mock_client_inst
-
-        # Create response mocks for flat container API
-        versions_response = MagicMock()
-        versions_response.raise_for_status = MagicMock()
-        versions_response.json.return_value = {"versions": ["1.0.0", "2.0.0", "3.14.0"]}
-
-        nuspec_response = MagicMock()
-        nuspec_response.raise_for_status = MagicMock()
-        nuspec_response.text = (
-            '<?xml version="1.0"?>'
-            "<package>"
-            '<repository url="https://github.com/JamesNK/Newtonsoft.Json" />'
-            "</package>"
-        )
-
-        # Setup async mocks for get method
-        mock_client_inst.get = AsyncMock(
-            side_effect=[versions_response, nuspec_response]
-        )
+        fake_http_client.responses = [
+            make_response(json={"versions": ["1.0.0", "2.0.0", "3.14.0"]}),
+            make_response(
+                text=(
+                    '<?xml version="1.0"?>'
+                    "<package>"
+                    '<repository url="https://github.com/JamesNK/Newtonsoft.Json" />'
+                    "</package>"
+                )
+            ),
+        ]
 
         resolver = CSharpResolver()
         result = await resolver.resolve_github_url("Newtonsoft.Json")
         assert result == ("JamesNK", "Newtonsoft.Json")
 
-    @patch("oss_sustain_guard.resolvers.csharp._get_async_http_client")
-    async def test_resolve_github_url_missing_repo(self, mock_get_client):
+    async def test_resolve_github_url_missing_repo(self, fake_http_client):
         """Test resolving NuGet package with no repository entry."""
-        mock_client_inst = MagicMock()
-        mock_get_client.return_value = mock_client_inst
-
-        versions_response = MagicMock()
-        versions_response.raise_for_status = MagicMock()
-        versions_response.json.return_value = {"versions": ["1.0.0"]}
-
-        nuspec_response = MagicMock()
-        nuspec_response.raise_for_status = MagicMock()
-        nuspec_response.text = '<?xml version="1.0"?><package></package>'
-
-        mock_client_inst.get = AsyncMock(
-            side_effect=[versions_response, nuspec_response]
-        )
+        fake_http_client.responses = [
+            make_response(json={"versions": ["1.0.0"]}),
+            make_response(text='<?xml version="1.0"?><package></package>'),
+        ]
 
         resolver = CSharpResolver()
         result = await resolver.resolve_github_url("NoRepo")
         assert result is None
 
-    @patch("oss_sustain_guard.resolvers.csharp._get_async_http_client")
-    async def test_resolve_github_url_not_found(self, mock_get_client):
+    async def test_resolve_github_url_not_found(self, fake_http_client):
         """Test resolving package not in NuGet."""
-        mock_client_inst = MagicMock()
-        mock_get_client.return_value = mock_client_inst
-
-        # Create response mocks
-        index_response = MagicMock()
-        index_response.raise_for_status = MagicMock()
-        index_response.json.return_value = {
-            "resources": [
-                {
-                    "@type": "RegistrationBaseUrl/3.6.0",
-                    "@id": "https://api.nuget.org/v3/registration5-semver1/",
+        fake_http_client.responses = [
+            make_response(
+                json={
+                    "resources": [
+                        {
+                            "@type": "RegistrationBaseUrl/3.6.0",
+                            "@id": "https://api.nuget.org/v3/registration5-semver1/",
+                        }
+                    ]
                 }
-            ]
-        }
-
-        pkg_response = MagicMock()
-        pkg_response.raise_for_status = MagicMock()
-        pkg_response.json.return_value = {"items": []}
-
-        mock_client_inst.get = AsyncMock(side_effect=[index_response, pkg_response])
+            ),
+            make_response(json={"items": []}),
+        ]
 
         resolver = CSharpResolver()
         result = await resolver.resolve_github_url("NonExistentPackage")
         assert result is None
 
-    @patch("oss_sustain_guard.resolvers.csharp._get_async_http_client")
-    async def test_resolve_github_url_network_error(self, mock_get_client):
+    async def test_resolve_github_url_network_error(self, fake_http_client):
         """Test resolving with network error."""
-        import httpx
-
-        mock_client_inst = MagicMock()
-        mock_get_client.return_value = mock_client_inst
-        mock_client_inst.get = AsyncMock(
-            side_effect=httpx.RequestError("Network error")
-        )
+        fake_http_client.responses = [httpx.RequestError("Network error")]
 
         resolver = CSharpResolver()
         result = await resolver.resolve_github_url("Newtonsoft.Json")
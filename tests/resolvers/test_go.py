@@ -2,49 +2,60 @@
 Tests for Go resolver.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from oss_sustain_guard.resolvers.go import GoResolver
 
+from ._helpers import make_response
+
+_NETWORK_ERROR = httpx.RequestError("Network error")
+
+# Expected error messages, compiled once for pytest.raises(match=...).
+_UNKNOWN_LOCKFILE_RE = re.compile("Unknown Go lockfile type")
+_UNKNOWN_MANIFEST_RE = re.compile("Unknown Go manifest file type")
+_MANIFEST_PARSE_ERROR_RE = re.compile(re.escape("Failed to parse go.mod"))
+
+
+@pytest.fixture(scope="module")
+def resolver() -> GoResolver:
+    """One GoResolver shared by the module; resolvers keep no state."""
+    return GoResolver()
+
 
 class TestGoResolver:
     """Test GoResolver class."""
 
-    def test_ecosystem_name(self):
+    def test_ecosystem_name(self, resolver):
         """Test ecosystem name."""
-        resolver = GoResolver()
         assert resolver.ecosystem_name == "go"
 
-    async def test_get_manifest_files(self):
+    async def test_get_manifest_files(self, resolver):
         """Test manifest files for Go."""
-        resolver = GoResolver()
         manifests = await resolver.get_manifest_files()
         assert "go.mod" in manifests
 
-    async def test_resolve_github_url_direct_path(self):
+    async def test_resolve_github_url_direct_path(self, resolver):
         """Test resolving GitHub path directly."""
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("github.com/golang/go")
         assert result == ("golang", "go")
 
-    async def test_resolve_github_url_with_subdomain(self):
+    async def test_resolve_github_url_with_subdomain(self, resolver):
         """Test resolving GitHub path with subdomain."""
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("github.com/sirupsen/logrus")
         assert result == ("sirupsen", "logrus")
 
-    async def test_resolve_github_url_with_version_suffix(self):
+    async def test_resolve_github_url_with_version_suffix(self, resolver):
         """Test resolving GitHub path with Go module version suffix."""
-        resolver = GoResolver()
         # go-redis/redis uses /v8 version suffix for v8.x releases
         result = await resolver.resolve_github_url("github.com/go-redis/redis/v8")
         assert result == ("go-redis", "redis")
 
-    async def test_resolve_github_url_with_v2_suffix(self):
+    async def test_resolve_github_url_with_v2_suffix(self, resolver):
         """Test resolving GitHub path with /v2 version suffix."""
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("github.com/user/repo/v2")
         assert result == ("user", "repo")
 
@@ -74,48 +85,44 @@ class TestGoResolver:
             == "github.com/v2ray/v2ray-core"
         )
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_github_url_golang_org(self, mock_get):
+    async def test_resolve_github_url_golang_org(self, mock_get, resolver):
         """Test resolving golang.org package via pkg.go.dev."""
-        mock_response = MagicMock()
-        mock_response.text = '<a href="https://github.com/golang/text">Repository</a>'
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(
+            text='<a href="https://github.com/golang/text">Repository</a>'
+        )
 
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("golang.org/x/text")
         assert result == ("golang", "text")
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_github_url_short_name(self, mock_get):
+    async def test_resolve_github_url_short_name(self, mock_get, resolver):
         """Test resolving short package name via pkg.go.dev search."""
         # Mock search response
-        search_response = MagicMock()
-        search_response.status_code = 200
-        search_response.text = """
+        search_response = make_response(
+            text="""
             <a href="/gorm.io/gorm" data-test-id="snippet-title">
               gorm
             </a>
         """
+        )
 
         # Mock package page response
-        package_response = MagicMock()
-        package_response.text = """
+        package_response = make_response(
+            text="""
             <div class="UnitMeta-repo">
                 <a href="https://github.com/go-gorm/gorm">github.com/go-gorm/gorm</a>
             </div>
         """
+        )
 
         mock_get.side_effect = [search_response, package_response]
 
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("gorm")
         assert result == ("go-gorm", "gorm")
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_github_url_with_unitmeta_repo(self, mock_get):
+    async def test_resolve_github_url_with_unitmeta_repo(self, mock_get, resolver):
         """Test resolving with UnitMeta-repo section."""
-        mock_response = MagicMock()
-        mock_response.text = """
+        mock_get.return_value = make_response(
+            text="""
             <h2>Repository</h2>
             <div class="UnitMeta-repo">
                 <a href="https://github.com/sirupsen/logrus" title="repo">
@@ -124,59 +131,43 @@ class TestGoResolver:
             </div>
             <a href="https://github.com/golang/go">Go Language</a>
         """
-        mock_get.return_value = mock_response
+        )
 
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("github.com/sirupsen/logrus")
         assert result == ("sirupsen", "logrus")
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_github_url_fallback_filtering(self, mock_get):
+    async def test_resolve_github_url_fallback_filtering(self, mock_get, resolver):
         """Test fallback pattern with golang/go filtering."""
-        mock_response = MagicMock()
-        mock_response.text = """
+        mock_get.return_value = make_response(
+            text="""
             <a href="https://github.com/golang/go">Go logo</a>
             <a href="https://github.com/user/repo">Repository</a>
         """
-        mock_get.return_value = mock_response
+        )
 
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("example.com/user/repo")
         assert result == ("user", "repo")
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_github_url_network_error(self, mock_get):
+    async def test_resolve_github_url_network_error(self, mock_get, resolver):
         """Test resolving with network error."""
-        import httpx
-
-        mock_get.side_effect = httpx.RequestError("Network error")
+        mock_get.side_effect = _NETWORK_ERROR
 
-        resolver = GoResolver()
         result = await resolver.resolve_github_url("golang.org/x/net")
         assert result is None
 
-    async def test_detect_lockfiles(self, tmp_path):
+    async def test_detect_lockfiles(self, tmp_path, resolver):
         """Test detecting Go lockfiles."""
         (tmp_path / "go.sum").touch()
         (tmp_path / "go.mod").touch()
 
-        resolver = GoResolver()
         lockfiles = await resolver.detect_lockfiles(str(tmp_path))
 
         lockfile_names = {lockfile.name for lockfile in lockfiles}
         assert lockfile_names == {"go.mod", "go.sum"}
 
-    async def test_parse_go_sum(self, tmp_path):
+    async def test_parse_go_sum(self, go_sum, resolver):
         """Test parsing go.sum."""
-        go_sum_content = """github.com/golang/go v1.21.0 h1:someHash
-github.com/sirupsen/logrus v1.9.0 h1:anotherHash
-golang.org/x/sys v0.10.0 h1:yetAnotherHash
-"""
-        sum_file = tmp_path / "go.sum"
-        sum_file.write_text(go_sum_content)
-
-        resolver = GoResolver()
-        packages = await resolver.parse_lockfile(str(sum_file))
+        packages = await resolver.parse_lockfile(str(go_sum))
 
         assert len(packages) == 3
         names = {p.name for p in packages}
@@ -185,28 +176,24 @@ golang.org/x/sys v0.10.0 h1:yetAnotherHash
         assert "golang.org/x/sys" in names
         assert all(p.ecosystem == "go" for p in packages)
 
-    async def test_parse_lockfile_not_found(self):
+    async def test_parse_lockfile_not_found(self, resolver):
         """Test parsing non-existent lockfile."""
-        resolver = GoResolver()
         with pytest.raises(FileNotFoundError):
             await resolver.parse_lockfile("/nonexistent/go.sum")
 
-    async def test_parse_lockfile_unknown_type(self, tmp_path):
+    async def test_parse_lockfile_unknown_type(self, tmp_path, resolver):
         """Test parsing unknown lockfile type."""
         unknown_file = tmp_path / "unknown.lock"
         unknown_file.touch()
 
-        resolver = GoResolver()
-        with pytest.raises(ValueError, match="Unknown Go lockfile type"):
+        with pytest.raises(ValueError, match=_UNKNOWN_LOCKFILE_RE):
             await resolver.parse_lockfile(str(unknown_file))
 
     @patch("aiofiles.open")
-    async def test_parse_lockfile_read_error(self, mock_aiofiles_open, tmp_path):
+    async def test_parse_lockfile_read_error(
+        self, mock_aiofiles_open, go_sum, resolver
+    ):
         """Test parsing go.sum with read error."""
-        # Create a temporary file that exists
-        sum_file = tmp_path / "go.sum"
-        sum_file.write_text("github.com/golang/go v1.21.0 h1:hash")
-
         # Create a mock file object that raises OSError when read
         mock_file = AsyncMock()
         mock_file.__aenter__.return_value = mock_file
@@ -215,41 +202,25 @@ golang.org/x/sys v0.10.0 h1:yetAnotherHash
 
         mock_aiofiles_open.return_value = mock_file
 
-        resolver = GoResolver()
-        packages = await resolver.parse_lockfile(str(sum_file))
+        packages = await resolver.parse_lockfile(str(go_sum))
         assert packages == []
 
-    async def test_parse_manifest_not_found(self):
+    async def test_parse_manifest_not_found(self, resolver):
         """Test parsing missing go.mod."""
-        resolver = GoResolver()
         with pytest.raises(FileNotFoundError):
             await resolver.parse_manifest("/missing/go.mod")
 
-    async def test_parse_manifest_unknown_type(self, tmp_path):
+    async def test_parse_manifest_unknown_type(self, tmp_path, resolver):
         """Test parsing unknown manifest type."""
         manifest = tmp_path / "go.txt"
         manifest.touch()
 
-        resolver = GoResolver()
-        with pytest.raises(ValueError, match="Unknown Go manifest file type"):
+        with pytest.raises(ValueError, match=_UNKNOWN_MANIFEST_RE):
             await resolver.parse_manifest(manifest)
 
-    async def test_parse_manifest_go_mod(self, tmp_path):
+    async def test_parse_manifest_go_mod(self, go_mod, resolver):
         """Test parsing go.mod with block and single-line requires."""
-        manifest = tmp_path / "go.mod"
-        manifest.write_text(
-            "module github.com/example/project\n"
-            "go 1.21\n"
-            "require (\n"
-            "  github.com/user/repo v1.2.3\n"
-            "  // comment\n"
-            "  github.com/other/repo v0.1.0\n"
-            ")\n"
-            "require github.com/single/repo v0.9.0\n"
-        )
-
-        resolver = GoResolver()
-        packages = await resolver.parse_manifest(manifest)
+        packages = await resolver.parse_manifest(go_mod)
 
         names = {pkg.name for pkg in packages}
         assert names == {
@@ -259,12 +230,10 @@ golang.org/x/sys v0.10.0 h1:yetAnotherHash
         }
 
     @patch("aiofiles.open")
-    async def test_parse_manifest_read_error(self, mock_aiofiles_open, tmp_path):
+    async def test_parse_manifest_read_error(
+        self, mock_aiofiles_open, go_mod, resolver
+    ):
         """Test parsing go.mod with read error."""
-        # Create a temporary file that exists
-        manifest = tmp_path / "go.mod"
-        manifest.write_text("module example\n")
-
         # Create a mock file object that raises OSError when read
         mock_file = AsyncMock()
         mock_file.__aenter__.return_value = mock_file
@@ -273,6 +242,5 @@ golang.org/x/sys v0.10.0 h1:yetAnotherHash
 
         mock_aiofiles_open.return_value = mock_file
 
-        resolver = GoResolver()
-        with pytest.raises(ValueError, match="Failed to parse go.mod"):
-            await resolver.parse_manifest(manifest)
+        with pytest.raises(ValueError, match=_MANIFEST_PARSE_ERROR_RE):
+            await resolver.parse_manifest(go_mod)
@@ -153,16 +153,12 @@ source-repository head
         assert len(packages) == 1
         assert packages[0].name == "text"
 
-    async def test_parse_cabal_freeze_read_error(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("failing_read_text")
+    async def test_parse_cabal_freeze_read_error(self, tmp_path):
         """Test read errors for cabal.project.freeze."""
         lockfile = tmp_path / "cabal.project.freeze"
         lockfile.write_text("constraints: any.text ==1.2.5.0")
 
-        def _raise(*_args, **_kwargs):
-            raise OSError("read error")
-
-        monkeypatch.setattr(lockfile.__class__, "read_text", _raise)
-
         resolver = HaskellResolver()
         with pytest.raises(ValueError, match="Failed to read cabal.project.freeze"):
             await resolver.parse_lockfile(lockfile)
@@ -182,16 +178,12 @@ source-repository head
         assert len(packages) == 1
         assert packages[0].name == "text"
 
-    async def test_parse_stack_lock_read_error(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("failing_read_text")
+    async def test_parse_stack_lock_read_error(self, tmp_path):
         """Test read errors for stack.yaml.lock."""
         lockfile = tmp_path / "stack.yaml.lock"
         lockfile.write_text("hackage: text-1.2.5.0@sha256:abc,456\n")
 
-        def _raise(*_args, **_kwargs):
-            raise OSError("read error")
-
-        monkeypatch.setattr(lockfile.__class__, "read_text", _raise)
-
         resolver = HaskellResolver()
         with pytest.raises(ValueError, match="Failed to read stack.yaml.lock"):
             await resolver.parse_lockfile(lockfile)
@@ -244,30 +236,22 @@ source-repository head
         assert len(packages) == 1
         assert packages[0].name == "text"
 
-    async def test_parse_manifest_cabal_project_read_error(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("failing_read_text")
+    async def test_parse_manifest_cabal_project_read_error(self, tmp_path):
         """Test read errors for cabal.project."""
         manifest = tmp_path / "cabal.project"
         manifest.write_text("constraints: any.text\n")
 
-        def _raise(*_args, **_kwargs):
-            raise OSError("read error")
-
-        monkeypatch.setattr(manifest.__class__, "read_text", _raise)
-
         resolver = HaskellResolver()
         with pytest.raises(ValueError, match="Failed to read cabal.project"):
             await resolver.parse_manifest(manifest)
 
-    async def test_parse_manifest_stack_read_error(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("failing_read_text")
+    async def test_parse_manifest_stack_read_error(self, tmp_path):
         """Test read errors for stack.yaml."""
         manifest = tmp_path / "stack.yaml"
         manifest.write_text("extra-deps:\n  - text-1.2.5.0\n")
 
-        def _raise(*_args, **_kwargs):
-            raise OSError("read error")
-
-        monkeypatch.setattr(manifest.__class__, "read_text", _raise)
-
         resolver = HaskellResolver()
         with pytest.raises(ValueError, match="Failed to read stack.yaml"):
             await resolver.parse_manifest(manifest)
@@ -2,120 +2,163 @@
 Tests for Perl resolver.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
-from oss_sustain_guard.resolvers.perl import PerlResolver
+from oss_sustain_guard import http_client
+from oss_sustain_guard.resolvers import perl
+from oss_sustain_guard.resolvers.perl import (
+    PerlResolver,
+    _parse_cpanfile,
+    _parse_cpanfile_snapshot,
+    _strip_distribution_version,
+)
+
+from ._helpers import make_response
+
+_NETWORK_ERROR = httpx.RequestError("Network error")
+
+
+@pytest.fixture
+def resolver() -> PerlResolver:
+    """A fresh PerlResolver per test so MetaCPAN answers are not cached across."""
+    return PerlResolver()
+
+
+# (MetaCPAN response or raised error, expected (owner, name) or None).
+_RESOLVE_CASES = (
+    (
+        make_response(
+            json={
+                "resources": {
+                    "repository": {"url": "https://github.com/mojolicious/mojo"}
+                }
+            }
+        ),
+        ("mojolicious", "mojo"),
+    ),
+    (
+        make_response(
+            json={
+                "resources": {
+                    "repository": {"web": "https://github.com/mojolicious/mojo"}
+                }
+            }
+        ),
+        ("mojolicious", "mojo"),
+    ),
+    (make_response(404), None),
+    (make_response(json={"resources": {"repository": {"url": ""}}}), None),
+    (_NETWORK_ERROR, None),
+)
 
 
 class TestPerlResolver:
     """Test PerlResolver class."""
 
-    def test_ecosystem_name(self):
+    def test_ecosystem_name(self, resolver):
         """Test ecosystem name."""
-        resolver = PerlResolver()
         assert resolver.ecosystem_name == "perl"
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_repository(self, mock_get):
-        """Test resolving repository from MetaCPAN response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "resources": {"repository": {"url": "https://github.com/mojolicious/mojo"}}
-        }
-        mock_get.return_value = mock_response
-
-        resolver = PerlResolver()
-        result = await resolver.resolve_repository("Mojolicious")
-        assert result is not None
-        assert result.owner == "mojolicious"
-        assert result.name == "mojo"
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        _RESOLVE_CASES,
+        ids=(
+            "repository_url",
+            "web_url",
+            "not_found",
+            "no_supported_url",
+            "request_error",
+        ),
+    )
+    async def test_resolve_repository(self, mock_get, resolver, response, expected):
+        """Test resolving a repository from each MetaCPAN response shape."""
+        # A one-item side_effect list returns a response or raises an error.
+        mock_get.side_effect = [response]
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_repository_not_found(self, mock_get):
-        """Test handling missing MetaCPAN package."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        result = await resolver.resolve_repository("Mojolicious")
+        assert (result and (result.owner, result.name)) == expected
+
+    async def test_resolve_repository_reuses_shared_client(self, mock_get, resolver):
+        """Test that lookups share one pooled HTTP client."""
+        mock_get.return_value = make_response(404)
+
+        await resolver.resolve_repository("Mojolicious")
+        client = http_client._async_http_client
+        await resolver.resolve_repository("DBI")
+
+        assert client is not None
+        assert http_client._async_http_client is client
+        assert mock_get.await_count == 2
+
+    async def test_resolve_repository_cached(self, mock_get, resolver):
+        """Test that repeated lookups of a package hit MetaCPAN once."""
+        mock_get.return_value = make_response(
+            json={
+                "resources": {
+                    "repository": {"url": "https://github.com/mojolicious/mojo"}
+                }
+            }
+        )
 
-        resolver = PerlResolver()
-        assert await resolver.resolve_repository("missing") is None
+        first = await resolver.resolve_repository("Mojolicious")
+        second = await resolver.resolve_repository("Mojolicious")
 
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_repository_request_error(self, mock_get):
-        """Test handling MetaCPAN request errors."""
-        import httpx
+        assert first is not None
+        assert second is first
+        assert mock_get.await_count == 1
 
-        mock_get.side_effect = httpx.RequestError("Network error")
+    async def test_resolve_repository_request_error_not_cached(
+        self, mock_get, resolver
+    ):
+        """Test that a failed lookup is retried on the next call."""
+        mock_get.side_effect = [_NETWORK_ERROR, make_response(404)]
 
-        resolver = PerlResolver()
         assert await resolver.resolve_repository("Mojolicious") is None
-
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_repository_web_url(self, mock_get):
-        """Test resolving repository from web URL field."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "resources": {"repository": {"web": "https://github.com/mojolicious/mojo"}}
-        }
-        mock_get.return_value = mock_response
-
-        resolver = PerlResolver()
-        result = await resolver.resolve_repository("Mojolicious")
-        assert result is not None
-        assert result.owner == "mojolicious"
-        assert result.name == "mojo"
-
-    @patch("httpx.AsyncClient.get")
-    async def test_resolve_repository_no_supported_url(self, mock_get):
-        """Test resolving package with no supported repository URLs."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"resources": {"repository": {"url": ""}}}
-        mock_get.return_value = mock_response
-
-        resolver = PerlResolver()
         assert await resolver.resolve_repository("Mojolicious") is None
+        assert mock_get.await_count == 2
 
-    async def test_parse_lockfile(self, tmp_path):
+    async def test_parse_lockfile(self, cpanfile_snapshot, resolver):
         """Test parsing cpanfile.snapshot."""
-        lockfile = tmp_path / "cpanfile.snapshot"
-        lockfile.write_text(
+        packages = await resolver.parse_lockfile(cpanfile_snapshot)
+        names = {pkg.name for pkg in packages}
+        assert names == {"Mojolicious", "Test-Simple"}
+
+    def test_parse_cpanfile_snapshot_duplicates(self):
+        """Test parsing cpanfile.snapshot content with duplicates."""
+        packages = _parse_cpanfile_snapshot(
             "DISTRIBUTIONS\n"
             "  distribution: Mojolicious-9.33\n"
-            "  distribution: Test-Simple-1.302190\n"
+            "  distribution: Mojolicious-9.33\n"
         )
 
-        resolver = PerlResolver()
-        packages = await resolver.parse_lockfile(lockfile)
-        names = {pkg.name for pkg in packages}
-        assert names == {"Mojolicious", "Test-Simple"}
+        assert len(packages) == 1
+        assert packages[0].name == "Mojolicious"
 
-    async def test_parse_lockfile_duplicates(self, tmp_path):
-        """Test parsing cpanfile.snapshot with duplicates."""
+    async def test_parse_lockfile_streamed(self, tmp_path, monkeypatch, resolver):
+        """Test parsing a large cpanfile.snapshot chunk by chunk."""
+        monkeypatch.setattr(perl, "_SNAPSHOT_STREAM_THRESHOLD", 0)
+        # Small chunks split lines mid-way to exercise the carry-over.
+        monkeypatch.setattr(perl, "_SNAPSHOT_CHUNK_SIZE", 7)
         lockfile = tmp_path / "cpanfile.snapshot"
         lockfile.write_text(
             "DISTRIBUTIONS\n"
             "  distribution: Mojolicious-9.33\n"
+            "  distribution: Test-Simple-1.302190\n"
             "  distribution: Mojolicious-9.33\n"
+            "  distribution: DBI-1.643"
         )
 
-        resolver = PerlResolver()
         packages = await resolver.parse_lockfile(lockfile)
-
-        assert len(packages) == 1
-        assert packages[0].name == "Mojolicious"
+        assert [pkg.name for pkg in packages] == ["Mojolicious", "Test-Simple", "DBI"]
 
     @patch("aiofiles.open")
-    async def test_parse_lockfile_read_error(self, mock_aiofiles_open, tmp_path):
+    async def test_parse_lockfile_read_error(
+        self, mock_aiofiles_open, cpanfile_snapshot, resolver
+    ):
         """Test error reading cpanfile.snapshot."""
-        # Create a temporary file that exists
-        lockfile = tmp_path / "cpanfile.snapshot"
-        lockfile.write_text("DISTRIBUTIONS\n  distribution: Mojolicious-9.33\n")
-
         # Create a mock file object that raises OSError when read
         mock_file = AsyncMock()
         mock_file.__aenter__.return_value = mock_file
@@ -124,52 +167,39 @@ class TestPerlResolver:
 
         mock_aiofiles_open.return_value = mock_file
 
-        resolver = PerlResolver()
         with pytest.raises(ValueError, match="Failed to read cpanfile.snapshot"):
-            await resolver.parse_lockfile(lockfile)
+            await resolver.parse_lockfile(cpanfile_snapshot)
 
-    async def test_parse_lockfile_not_found(self):
+    async def test_parse_lockfile_not_found(self, resolver):
         """Test missing lockfile."""
-        resolver = PerlResolver()
         with pytest.raises(FileNotFoundError):
             await resolver.parse_lockfile("/missing/cpanfile.snapshot")
 
-    async def test_parse_lockfile_unknown(self, tmp_path):
+    async def test_parse_lockfile_unknown(self, tmp_path, resolver):
         """Test unknown lockfile type."""
         unknown = tmp_path / "unknown.lock"
         unknown.touch()
 
-        resolver = PerlResolver()
         with pytest.raises(ValueError, match="Unknown Perl lockfile type"):
             await resolver.parse_lockfile(unknown)
 
-    async def test_parse_manifest(self, tmp_path):
+    async def test_parse_manifest(self, cpanfile, resolver):
         """Test parsing cpanfile."""
-        manifest = tmp_path / "cpanfile"
-        manifest.write_text("requires 'Mojolicious', '9.00';\nrequires \"DBI\";\n")
-
-        resolver = PerlResolver()
-        packages = await resolver.parse_manifest(manifest)
+        packages = await resolver.parse_manifest(cpanfile)
         names = {pkg.name for pkg in packages}
         assert names == {"Mojolicious", "DBI"}
 
-    async def test_parse_manifest_duplicates(self, tmp_path):
-        """Test parsing cpanfile with duplicate dependencies."""
-        manifest = tmp_path / "cpanfile"
-        manifest.write_text("requires 'DBI';\nrequires 'DBI';\n")
-
-        resolver = PerlResolver()
-        packages = await resolver.parse_manifest(manifest)
+    def test_parse_cpanfile_duplicates(self):
+        """Test parsing cpanfile content with duplicate dependencies."""
+        packages = _parse_cpanfile("requires 'DBI';\nrequires 'DBI';\n")
         assert len(packages) == 1
         assert packages[0].name == "DBI"
 
     @patch("aiofiles.open")
-    async def test_parse_manifest_read_error(self, mock_aiofiles_open, tmp_path):
+    async def test_parse_manifest_read_error(
+        self, mock_aiofiles_open, cpanfile, resolver
+    ):
         """Test error reading cpanfile."""
-        # Create a temporary file that exists
-        manifest = tmp_path / "cpanfile"
-        manifest.write_text("requires 'DBI';\n")
-
         # Create a mock file object that raises OSError when read
         mock_file = AsyncMock()
         mock_file.__aenter__.return_value = mock_file
@@ -178,28 +208,26 @@ class TestPerlResolver:
 
         mock_aiofiles_open.return_value = mock_file
 
-        resolver = PerlResolver()
         with pytest.raises(ValueError, match="Failed to read cpanfile"):
-            await resolver.parse_manifest(manifest)
+            await resolver.parse_manifest(cpanfile)
 
-    async def test_parse_manifest_not_found(self):
+    async def test_parse_manifest_not_found(self, resolver):
         """Test missing manifest."""
-        resolver = PerlResolver()
         with pytest.raises(FileNotFoundError):
             await resolver.parse_manifest("/missing/cpanfile")
 
-    async def test_parse_manifest_unknown(self, tmp_path):
+    async def test_parse_manifest_unknown(self, tmp_path, resolver):
         """Test unknown manifest type."""
         unknown = tmp_path / "unknown"
         unknown.touch()
 
-        resolver = PerlResolver()
         with pytest.raises(ValueError, match="Unknown Perl manifest file type"):
             await resolver.parse_manifest(unknown)
 
     def test_strip_distribution_version(self):
         """Test stripping distribution version."""
-        from oss_sustain_guard.resolvers.perl import _strip_distribution_version
-
         assert _strip_distribution_version("Mojolicious-9.33") == "Mojolicious"
         assert _strip_distribution_version("DBI") == "DBI"
+        assert _strip_distribution_version("libwww-perl-6.72") == "libwww-perl"
+        assert _strip_distribution_version("Foo-2x-Bar") == "Foo"
+        assert _strip_distribution_version("-1.0") == "-1.0"
@@ -10,20 +10,35 @@ from oss_sustain_guard.core import AnalysisResult, Metric
 from oss_sustain_guard.repository import RepositoryReference
 
 
+def _example_repo(name, provider="github"):
+    """Build a reference to the example/<name> repository on the provider."""
+    return RepositoryReference(
+        provider=provider,
+        host=f"{provider}.com",
+        path=f"example/{name}",
+        owner="example",
+        name=name,
+    )
+
+
 class FakeResolver:
     """Resolver stub that returns predefined repository references."""
 
+    __slots__ = ("_lookup",)
+
     def __init__(self, mapping):
-        self._mapping = mapping
+        # Bind the mapping's get once; lookups then skip the dict attribute.
+        self._lookup = mapping.get
 
     async def resolve_repository(self, package_name):
-        return self._mapping.get(package_name)
+        return self._lookup(package_name)
 
 
 async def test_analyze_packages_parallel_empty():
     """Empty inputs return an empty result list."""
-    results, _ = await analyze_packages_parallel([], {})
+    results, logs = await analyze_packages_parallel([], {})
     assert results == []
+    assert logs == {}
 
 
 async def test_analyze_packages_parallel_single_uses_analyze_package():
@@ -34,17 +49,7 @@ async def test_analyze_packages_parallel_single_uses_analyze_package():
         metrics=[Metric("Metric", 9, 10, "Observation", "Low")],
     )
 
-    resolver = FakeResolver(
-        {
-            "project": RepositoryReference(
-                provider="github",
-                host="github.com",
-                path="example/project",
-                owner="example",
-                name="project",
-            ),
-        }
-    )
+    resolver = FakeResolver({"project": _example_repo("project")})
 
     with (
         patch(
@@ -99,20 +104,8 @@ async def test_analyze_packages_parallel_mixed_results():
 
     resolver = FakeResolver(
         {
-            "live": RepositoryReference(
-                provider="github",
-                host="github.com",
-                path="example/live",
-                owner="example",
-                name="live",
-            ),
-            "nongh": RepositoryReference(
-                provider="gitlab",
-                host="gitlab.com",
-                path="example/nongh",
-                owner="example",
-                name="nongh",
-            ),
+            "live": _example_repo("live"),
+            "nongh": _example_repo("nongh", provider="gitlab"),
         }
     )
 
@@ -188,20 +181,8 @@ async def test_analyze_packages_parallel_non_batch_handles_exceptions():
     """Non-batch mode handles per-package errors."""
     resolver = FakeResolver(
         {
-            "pkg1": RepositoryReference(
-                provider="github",
-                host="github.com",
-                path="example/pkg1",
-                owner="example",
-                name="pkg1",
-            ),
-            "pkg2": RepositoryReference(
-                provider="github",
-                host="github.com",
-                path="example/pkg2",
-                owner="example",
-                name="pkg2",
-            ),
+            "pkg1": _example_repo("pkg1"),
+            "pkg2": _example_repo("pkg2"),
         }
     )
 
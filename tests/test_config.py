@@ -3,12 +3,12 @@ Tests for the configuration module.
 """
 
 import ssl
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+import oss_sustain_guard.config
 from oss_sustain_guard.config import (
     get_cache_dir,
     get_cache_ttl,
@@ -27,21 +27,10 @@ from oss_sustain_guard.config import (
 
 
 @pytest.fixture
-def temp_project_root(monkeypatch):
-    """Create a temporary project root for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Patch PROJECT_ROOT
-        import oss_sustain_guard.config
-
-        original_root = oss_sustain_guard.config.PROJECT_ROOT
-        oss_sustain_guard.config.PROJECT_ROOT = tmpdir_path
-
-        yield tmpdir_path
-
-        # Restore
-        oss_sustain_guard.config.PROJECT_ROOT = original_root
+def temp_project_root(tmp_path, monkeypatch):
+    """Point PROJECT_ROOT at the per-test temporary directory."""
+    monkeypatch.setattr("oss_sustain_guard.config.PROJECT_ROOT", tmp_path)
+    return tmp_path
 
 
 def test_get_excluded_packages_from_local_config(temp_project_root):
@@ -74,6 +63,24 @@ exclude = ["requests", "numpy"]
     assert "numpy" in excluded
 
 
+def test_get_excluded_packages_cached_until_config_changes(temp_project_root):
+    """Test that the exclusion list is re-parsed only when a config file changes."""
+    config_file = temp_project_root / ".oss-sustain-guard.toml"
+    config_file.write_text('[tool.oss-sustain-guard]\nexclude = ["flask"]\n')
+
+    with patch(
+        "oss_sustain_guard.config.load_config_file",
+        wraps=oss_sustain_guard.config.load_config_file,
+    ) as mock_load:
+        assert get_excluded_packages() == frozenset({"flask"})
+        assert get_excluded_packages() == frozenset({"flask"})
+        assert mock_load.call_count == 1
+
+        config_file.write_text('[tool.oss-sustain-guard]\nexclude = ["requests"]\n')
+        assert get_excluded_packages() == frozenset({"requests"})
+        assert mock_load.call_count == 2
+
+
 def test_local_config_takes_priority(temp_project_root):
     """Test that .oss-sustain-guard.toml takes priority over pyproject.toml."""
     # Create pyproject.toml
@@ -125,16 +132,16 @@ def test_is_package_excluded_returns_false_for_non_excluded():
 
 
 def test_get_excluded_packages_empty_config(temp_project_root):
-    """Test that empty config returns empty list."""
+    """Test that empty config returns an empty set."""
     excluded = get_excluded_packages()
-    assert excluded == []
+    assert excluded == frozenset()
 
 
 def test_get_excluded_packages_missing_files(temp_project_root):
-    """Test that missing files return empty list."""
+    """Test that missing files return an empty set."""
     # No config files created
     excluded = get_excluded_packages()
-    assert excluded == []
+    assert excluded == frozenset()
 
 
 def test_get_cache_dir_default():
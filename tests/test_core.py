@@ -12,6 +12,7 @@ from oss_sustain_guard.core import (
     Metric,
     analyze_repository,
 )
+from oss_sustain_guard.vcs.base import VCSRepositoryData
 
 # --- Mocks ---
 
@@ -26,175 +27,112 @@ def mock_vcs_provider():
 # --- Tests ---
 
 
-async def test_analyze_repository_structure(mock_vcs_provider):
-    """
-    Tests that analyze_repository returns the correct data structure.
-    This test uses the VCS abstraction layer.
-    """
-    # Arrange - Mock VCS provider
-    mock_provider_instance = MagicMock()
-    mock_vcs_provider.return_value = mock_provider_instance
-
-    # Mock VCSRepositoryData
-    from oss_sustain_guard.vcs.base import VCSRepositoryData
-
-    mock_vcs_data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at="2024-12-06T10:00:00Z",
-        owner_type="User",
-        owner_login="testuser",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch=None,
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[{"author": {"user": {"login": "user1"}}}],
-        total_commits=1,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data={
-            "isArchived": False,
-            "pushedAt": "2024-12-06T10:00:00Z",
-            "owner": {"__typename": "User", "login": "testuser"},
-            "defaultBranchRef": {
-                "target": {
-                    "history": {
-                        "edges": [{"node": {"author": {"user": {"login": "user1"}}}}]
-                    }
+# One-commit repository payload shared read-only by TestAnalyzeOneCommitRepository.
+_ONE_COMMIT_REPO_DATA = VCSRepositoryData(
+    is_archived=False,
+    pushed_at="2024-12-06T10:00:00Z",
+    owner_type="User",
+    owner_login="test-owner",
+    owner_name=None,
+    star_count=0,
+    description=None,
+    homepage_url=None,
+    topics=[],
+    readme_size=None,
+    contributing_file_size=None,
+    default_branch=None,
+    watchers_count=0,
+    open_issues_count=0,
+    language=None,
+    commits=[{"author": {"user": {"login": "user1"}}}],
+    total_commits=1,
+    merged_prs=[],
+    closed_prs=[],
+    total_merged_prs=0,
+    releases=[],
+    open_issues=[],
+    closed_issues=[],
+    total_closed_issues=0,
+    vulnerability_alerts=None,
+    has_security_policy=False,
+    code_of_conduct=None,
+    license_info=None,
+    has_wiki=False,
+    has_issues=True,
+    has_discussions=False,
+    funding_links=[],
+    forks=[],
+    total_forks=0,
+    ci_status=None,
+    sample_counts={},
+    raw_data={
+        "isArchived": False,
+        "pushedAt": "2024-12-06T10:00:00Z",
+        "owner": {"__typename": "User", "login": "test-owner"},
+        "defaultBranchRef": {
+            "target": {
+                "history": {
+                    "edges": [{"node": {"author": {"user": {"login": "user1"}}}}]
                 }
-            },
-            "pullRequests": {"edges": []},
-            "fundingLinks": [],
+            }
         },
-    )
-    mock_provider_instance.get_repository_data = AsyncMock(return_value=mock_vcs_data)
-    mock_provider_instance.get_repository_url.return_value = (
-        "https://github.com/test-owner/test-repo"
-    )
+        "pullRequests": {"edges": []},
+        "fundingLinks": [],
+    },
+)
 
-    # Act
-    result = await analyze_repository("test-owner", "test-repo")
 
-    # Assert
-    assert isinstance(result, AnalysisResult)
-    assert result.repo_url == "https://github.com/test-owner/test-repo"
-    assert isinstance(result.total_score, int)
-    assert isinstance(result.metrics, list)
-    assert len(result.metrics) > 0
+@pytest.fixture(scope="class")
+def one_commit_provider():
+    """Patch the VCS provider once for the class to serve the shared payload."""
+    with patch("oss_sustain_guard.core.get_vcs_provider") as mock_provider:
+        provider = mock_provider.return_value
+        provider.get_repository_data = AsyncMock(return_value=_ONE_COMMIT_REPO_DATA)
+        provider.get_repository_url.return_value = (
+            "https://github.com/test-owner/test-repo"
+        )
+        yield mock_provider
 
-    first_metric = result.metrics[0]
-    assert isinstance(first_metric, Metric)
-    assert isinstance(first_metric.name, str)
-    assert isinstance(first_metric.score, int)
-    assert isinstance(first_metric.risk, str)
 
+@pytest.mark.usefixtures("one_commit_provider")
+class TestAnalyzeOneCommitRepository:
+    """analyze_repository over the shared one-commit repository payload."""
 
-async def test_total_score_is_sum_of_metric_scores(mock_vcs_provider):
-    """
-    Tests that the total_score is calculated using category-weighted approach.
-    """
-    # Arrange
-    from oss_sustain_guard.vcs.base import VCSRepositoryData
+    async def test_analyze_repository_structure(self):
+        """
+        Tests that analyze_repository returns the correct data structure.
+        This test uses the VCS abstraction layer.
+        """
+        result = await analyze_repository("test-owner", "test-repo")
 
-    mock_provider_instance = MagicMock()
-    mock_vcs_provider.return_value = mock_provider_instance
+        assert isinstance(result, AnalysisResult)
+        assert result.repo_url == "https://github.com/test-owner/test-repo"
+        assert isinstance(result.total_score, int)
+        assert isinstance(result.metrics, list)
+        assert len(result.metrics) > 0
 
-    mock_vcs_data = VCSRepositoryData(
-        is_archived=False,
-        pushed_at="2024-12-06T10:00:00Z",
-        owner_type="User",
-        owner_login="test-owner",
-        owner_name=None,
-        star_count=0,
-        description=None,
-        homepage_url=None,
-        topics=[],
-        readme_size=None,
-        contributing_file_size=None,
-        default_branch=None,
-        watchers_count=0,
-        open_issues_count=0,
-        language=None,
-        commits=[{"author": {"user": {"login": "user1"}}}],
-        total_commits=1,
-        merged_prs=[],
-        closed_prs=[],
-        total_merged_prs=0,
-        releases=[],
-        open_issues=[],
-        closed_issues=[],
-        total_closed_issues=0,
-        vulnerability_alerts=None,
-        has_security_policy=False,
-        code_of_conduct=None,
-        license_info=None,
-        has_wiki=False,
-        has_issues=True,
-        has_discussions=False,
-        funding_links=[],
-        forks=[],
-        total_forks=0,
-        ci_status=None,
-        sample_counts={},
-        raw_data={
-            "isArchived": False,
-            "pushedAt": "2024-12-06T10:00:00Z",
-            "owner": {"__typename": "User", "login": "test-owner"},
-            "defaultBranchRef": {
-                "target": {
-                    "history": {
-                        "edges": [{"node": {"author": {"user": {"login": "user1"}}}}]
-                    }
-                }
-            },
-            "pullRequests": {"edges": []},
-            "fundingLinks": [],
-        },
-    )
-    mock_provider_instance.get_repository_data = AsyncMock(return_value=mock_vcs_data)
-    mock_provider_instance.get_repository_url.return_value = (
-        "https://github.com/test-owner/test-repo"
-    )
+        first_metric = result.metrics[0]
+        assert isinstance(first_metric, Metric)
+        assert isinstance(first_metric.name, str)
+        assert isinstance(first_metric.score, int)
+        assert isinstance(first_metric.risk, str)
 
-    # Act
-    result = await analyze_repository("test-owner", "test-repo")
+    async def test_total_score_is_sum_of_metric_scores(self):
+        """
+        Tests that the total_score is calculated using category-weighted approach.
+        """
+        result = await analyze_repository("test-owner", "test-repo")
 
-    # Assert
-    # Score should be normalized to 100-point scale using category weights
-    assert 0 <= result.total_score <= 100  # Score should be within valid range
-    # New: score is computed via compute_weighted_total_score
-    # which uses category-based weighting, not simple sum normalization
+        # Score should be normalized to 100-point scale using category weights
+        assert 0 <= result.total_score <= 100  # Score should be within valid range
+        # New: score is computed via compute_weighted_total_score
+        # which uses category-based weighting, not simple sum normalization
 
 
 @patch.dict("os.environ", {"GITHUB_TOKEN": "fake_token"}, clear=True)
 async def test_analyze_repository_with_vcs_provider(mock_vcs_provider):
     """Test analyze_repository using VCS provider."""
     # Arrange
-    from oss_sustain_guard.vcs.base import VCSRepositoryData
-
     mock_provider_instance = MagicMock()
     mock_vcs_provider.return_value = mock_provider_instance
 
@@ -1,5 +1,6 @@
 """Tests for GitHub VCS provider."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -8,6 +9,13 @@ import pytest
 from oss_sustain_guard.vcs.github import GitHubProvider
 
 
+def _graphql_response(payload: dict) -> SimpleNamespace:
+    """Stand-in for a successful GraphQL ``httpx.Response`` carrying ``payload``."""
+    return SimpleNamespace(
+        json=lambda: payload, raise_for_status=lambda: None, request=None
+    )
+
+
 def test_github_provider_requires_token():
     """Test that GitHubProvider requires a token."""
     with patch.dict("os.environ", {}, clear=True):
@@ -52,10 +60,7 @@ async def test_github_provider_get_repository_data(mock_get_client):
     """Test GitHubProvider fetches and normalizes repository data."""
     # Mock HTTP client response
     mock_client = mock_get_client.return_value
-    mock_response = MagicMock()
-    mock_client.post.return_value = mock_response
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
+    payload = {
         "data": {
             "repository": {
                 "isArchived": False,
@@ -120,6 +125,7 @@ async def test_github_provider_get_repository_data(mock_get_client):
             }
         }
     }
+    mock_client.post.return_value = _graphql_response(payload)
 
     provider = GitHubProvider(token="test_token")
     vcs_data = await provider.get_repository_data("testorg", "testrepo")
@@ -141,10 +147,7 @@ async def test_github_provider_get_repository_data(mock_get_client):
 async def test_github_provider_handles_missing_repository(mock_get_client):
     """Test GitHubProvider handles missing repository."""
     mock_client = mock_get_client.return_value
-    mock_response = MagicMock()
-    mock_client.post.return_value = mock_response
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {"data": {"repository": None}}
+    mock_client.post.return_value = _graphql_response({"data": {"repository": None}})
 
     provider = GitHubProvider(token="test_token")
 
@@ -174,11 +177,9 @@ async def test_github_provider_handles_api_error(mock_get_client):
 async def test_github_provider_handles_graphql_errors(mock_get_client):
     """Test GitHubProvider handles GraphQL errors in response."""
     mock_client = mock_get_client.return_value
-    mock_response = MagicMock()
-    mock_client.post.return_value = mock_response
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {"errors": [{"message": "Some GraphQL error"}]}
-    mock_response.request = None
+    mock_client.post.return_value = _graphql_response(
+        {"errors": [{"message": "Some GraphQL error"}]}
+    )
 
     provider = GitHubProvider(token="test_token")
 